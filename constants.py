@@ -1,6 +1,10 @@
+
 # constants.py
 
-STEP_TYPE_COLORS = {
+from types import MappingProxyType
+
+# Read-only view so the shared table can't be mutated at runtime
+STEP_TYPE_COLORS = MappingProxyType({
     "movement": "#D3D3D3",          # Light Gray
     "suction": "#ADD8E6",           # Light Blue
     "relay": "#90EE90",             # Light Green
@@ -9,4 +13,4 @@ STEP_TYPE_COLORS = {
     "torque": "#E6E6FA",            # Lavender
     "dynamic_adaptation": "#F08080",# Light Coral
     "other": "#FFFFFF"              # White for unknown types
-}
+})
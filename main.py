@@ -1,9 +1,17 @@
 # main.py
 
+import logging
+
 import customtkinter as ctk
 from multi_robot_app import MultiRobotApp
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    # Set the theme before creating the root so widgets are born themed
+    ctk.set_appearance_mode("Dark")
+    ctk.set_default_color_theme("blue")
+
     root = ctk.CTk()
     app = MultiRobotApp(root)
     root.protocol("WM_DELETE_WINDOW", app.close_all_connections)
@@ -1,15 +1,31 @@
 # multi_robot_app.py
 
 import customtkinter as ctk
-from tkinter import messagebox, simpledialog
+from tkinter import messagebox
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import threading
+import time
+from queue import SimpleQueue, Empty
 
-from robot_control_frame import RobotControlFrame  # Import the RobotControlFrame class
-from scheduler import SchedulerFrame               # Import the SchedulerFrame class
-from constants import STEP_TYPE_COLORS            # Import shared constants if needed
+# RobotControlFrame and SchedulerFrame are imported lazily in
+# MultiRobotApp._build_tabs, which runs once the main loop is up, so the window
+# paints before serial/OpenCV/PIL load and the ports open.
+
+log = logging.getLogger(__name__)
+
+# (tab name, serial port) for each robot arm; add a row to control another arm
+ROBOT_CONFIG = [
+    ("Robot 1", "COM9"),
+    ("Robot 2", "COM10"),
+]
 
 
 class MultiRobotApp:
+    __slots__ = ("master", "_mission_pool", "_current_mission_futures", "_ui_queue", "main_frame", "tabview",
+                 "robots", "scheduler", "_reps_var", "_update_play_button")
+
     def __init__(self, master):
         """
         Initializes the MultiRobotApp.
@@ -17,88 +33,104 @@ class MultiRobotApp:
         Args:
             master (ctk.CTk): The main application window.
         """
-        print("[DEBUG] Initializing MultiRobotApp")
+        log.debug("Initializing MultiRobotApp")
         self.master = master
         self.master.title("RoArm M2 IK Control - Multi-Robot Control")
         self.master.geometry("1600x1200")  # Increased window size for better fit
         self.master.minsize(1400, 1000)    # Set a minimum window size
 
-        # Set theme
-        ctk.set_appearance_mode("Dark")
-        ctk.set_default_color_theme("blue")
+        # Persistent worker pool for dispatching missions to every robot
+        self._mission_pool = ThreadPoolExecutor(max_workers=len(ROBOT_CONFIG), thread_name_prefix="mission")
+        self._current_mission_futures = []
+        # Callables posted by pool workers to run on the Tk thread
+        self._ui_queue = SimpleQueue()
 
-        # Create a Scrollable Frame to hold all content
-        self.scrollable_frame = ctk.CTkScrollableFrame(self.master, width=1600, height=1200)
-        self.scrollable_frame.pack(expand=True, fill="both", padx=10, pady=10)
-        self.scrollable_frame.columnconfigure(0, weight=1)
-        self.scrollable_frame.rowconfigure(0, weight=1)
+        # Create a plain frame to hold all content; the tabs fit the window at
+        # its minimum size, so a scrollable canvas would only add resize work
+        self.main_frame = ctk.CTkFrame(self.master)
+        self.main_frame.pack(expand=True, fill="both", padx=10, pady=10)
+        self.main_frame.columnconfigure(0, weight=1)
+        self.main_frame.rowconfigure(0, weight=1)
 
-        # Create a TabView inside the Scrollable Frame
-        self.tabview = ctk.CTkTabview(self.scrollable_frame)
+        # Create a TabView inside the main frame
+        self.tabview = ctk.CTkTabview(self.main_frame)
         self.tabview.grid(row=0, column=0, sticky="nsew")
 
-        # Add tabs
-        self.tab1 = self.tabview.add("Robot 1")
-        self.tab2 = self.tabview.add("Robot 2")
-        self.tab3 = self.tabview.add("Global Controls")
-        self.tab4 = self.tabview.add("Scheduler")  # New Scheduler Tab
+        # The tabs are built from the main loop, after the window has mapped
+        self.robots = []
+        self.scheduler = None
+        self.master.after(0, self._build_tabs)
+        self.master.after(100, self._process_ui_queue)
 
-        # Initialize RobotControlFrame instances within their respective tabs
-        self.robot1 = self.create_robot_frame(self.tabview.tab("Robot 1"), "Robot 1", "COM9")
-        self.robot2 = self.create_robot_frame(self.tabview.tab("Robot 2"), "Robot 2", "COM10")
+        log.debug("MultiRobotApp initialized successfully")
 
-        # Initialize Global Mission Controls within the "Global Controls" tab
-        self.create_global_mission_controls(self.tabview.tab("Global Controls"))
+    def _build_tabs(self):
+        """
+        Imports the robot and scheduler frames, opens the serial ports and
+        builds every tab. Runs on the Tk thread once the main loop is up.
+        """
+        # Draw the empty window before the slow imports and port opens
+        self.master.update_idletasks()
 
-        # Initialize SchedulerFrame within the "Scheduler" tab
-        self.scheduler = self.create_scheduler_frame(self.tabview.tab("Scheduler"))
+        from robot_control_frame import RobotControlFrame
+        from scheduler import SchedulerFrame
 
-        print("[DEBUG] MultiRobotApp initialized successfully")
+        # Add a tab and a RobotControlFrame for each configured robot; ports
+        # are opened and widgets built below
+        for robot_name, com_port in ROBOT_CONFIG:
+            tab_robot = self.tabview.add(robot_name)
+            log.debug("Creating RobotControlFrame for %s on %s", robot_name, com_port)
+            self.robots.append(RobotControlFrame(tab_robot, com_port, robot_name, connect=False))
 
-    def create_robot_frame(self, parent, robot_name, com_port):
-        """
-        Creates a RobotControlFrame within the specified parent frame.
+        # Open the serial ports in parallel; each open blocks while the board
+        # resets, so startup waits max(t) instead of sum(t). Widgets are only
+        # built afterwards, back on the Tk thread.
+        with ThreadPoolExecutor(max_workers=len(self.robots), thread_name_prefix="serial-open") as pool:
+            list(pool.map(lambda robot: robot.open_port(), self.robots))
+        for robot in self.robots:
+            robot.build_widgets()
 
-        Args:
-            parent (ctk.CTkFrame): The parent frame (a tab in TabView).
-            robot_name (str): Name of the robot (e.g., "Robot 1").
-            com_port (str): COM port for serial communication.
+        tab_global = self.tabview.add("Global Controls")
+        tab_sched = self.tabview.add("Scheduler")
 
-        Returns:
-            RobotControlFrame: The created RobotControlFrame instance.
-        """
-        print(f"[DEBUG] Creating RobotControlFrame for {robot_name} on {com_port}")
-        robot = RobotControlFrame(parent, com_port, robot_name)
-        print(f"[DEBUG] RobotControlFrame for {robot_name} created successfully")
-        return robot
+        # Initialize Global Mission Controls within the "Global Controls" tab
+        self.create_global_mission_controls(tab_global)
 
-    def create_scheduler_frame(self, parent):
-        """
-        Creates the SchedulerFrame within the specified parent frame.
+        # Initialize SchedulerFrame within the "Scheduler" tab
+        log.debug("Creating SchedulerFrame")
+        self.scheduler = SchedulerFrame(tab_sched, self.robots)
+        self.scheduler.pack(padx=10, pady=10, fill="both", expand=True)
 
-        Args:
-            parent (ctk.CTkFrame): The parent frame (Scheduler tab).
+        log.debug("All tabs built")
 
-        Returns:
-            SchedulerFrame: The created SchedulerFrame instance.
-        """
-        print("[DEBUG] Creating SchedulerFrame")
-        scheduler = SchedulerFrame(parent, self.robot1, self.robot2)
-        scheduler.pack(padx=10, pady=10, fill="both", expand=True)
-        print("[DEBUG] SchedulerFrame created successfully")
-        return scheduler
+    def _process_ui_queue(self):
+        """Runs callables posted by worker threads on the Tk thread, then polls again."""
+        try:
+            while True:
+                self._ui_queue.get_nowait()()
+        except Empty:
+            pass
+        finally:
+            self.master.after(100, self._process_ui_queue)
 
     ##################################################################
     #                Global Mission Controls                          #
     ##################################################################
     def create_global_mission_controls(self, parent):
-        print("[DEBUG] Creating Global Mission Controls")  # Debugging statement
+        log.debug("Creating Global Mission Controls")
         frame = ctk.CTkFrame(parent, corner_radius=10)
         frame.pack(padx=10, pady=10, fill="both", expand=True)
 
         title_label = ctk.CTkLabel(frame, text="Global Mission Controls", font=("Arial", 14, "bold"))
         title_label.pack(pady=10)
 
+        # Repetitions entry, read directly when the button is clicked
+        reps_frame = ctk.CTkFrame(frame)
+        reps_frame.pack(padx=20, pady=(10, 0), fill="x")
+        ctk.CTkLabel(reps_frame, text="Repetitions:", font=("Arial", 14)).pack(side="left", padx=5)
+        self._reps_var = tk.IntVar(value=1)
+        ctk.CTkEntry(reps_frame, textvariable=self._reps_var, width=80).pack(side="left", padx=5)
+
         # Play Both Missions Button
         play_both_button = ctk.CTkButton(
             frame,
@@ -110,56 +142,128 @@ class MultiRobotApp:
         )
         play_both_button.pack(padx=20, pady=20, fill="x")
 
+        # Stop Both Missions Button
+        stop_both_button = ctk.CTkButton(
+            frame,
+            text="Stop Both Missions",
+            command=self.stop_both_missions,
+            width=300,
+            height=60,
+            font=("Arial", 16)
+        )
+        stop_both_button.pack(padx=20, pady=(0, 20), fill="x")
+
+        # Only enable the button while every robot has a mission selected
+        # and no earlier dispatch is still running
+        def update_play_button(*_):
+            ready = all(robot.selected_mission_var.get() for robot in self.robots)
+            ready = ready and not self._missions_running()
+            play_both_button.configure(state="normal" if ready else "disabled")
+
+        self._update_play_button = update_play_button
+        for robot in self.robots:
+            robot.selected_mission_var.trace_add("write", update_play_button)
+        update_play_button()
+
     def play_both_missions(self):
         """
         Handles the "Play Both Missions" button click.
-        Executes missions for both robots concurrently.
+        Executes missions for all robots concurrently.
         """
-        # Check if both robots have a selected mission
-        if not self.robot1.selected_mission or not self.robot2.selected_mission:
-            messagebox.showerror("Error", "Both robots must have a mission selected.")
-            print("[ERROR] Both robots must have a mission selected.")
+        # The button is only enabled once every robot has a mission selected.
+        # Reject repeat clicks so two dispatches never stream commands at once.
+        if self._missions_running():
+            log.debug("Missions already running; ignoring click.")
             return
 
-        # Ask for repetitions once for both missions
-        times = simpledialog.askinteger("Play Both Missions", "Enter number of repetitions:", initialvalue=1, parent=self.master)
-        if times is None or times < 1:
-            print("[DEBUG] Invalid number of repetitions entered.")
+        # Repetitions come from the entry next to the button
+        try:
+            times = self._reps_var.get()
+        except tk.TclError:
+            times = 0
+        if times < 1:
+            log.debug("Invalid number of repetitions entered.")
             return
 
-        # Define a function to play both missions concurrently
-        def play_both():
-            # Start playing Robot 1's mission
-            def play_robot1():
-                print("[DEBUG] Starting Robot 1's mission")
-                self.robot1.play_mission_specific(times)
+        # Dispatch every robot's mission on the persistent pool
+        self._current_mission_futures = []
+        for robot in self.robots:
+            future = self._mission_pool.submit(self._run_mission, robot, times)
+            future.add_done_callback(lambda f, name=robot.robot_name: self._on_mission_done(f, name))
+            self._current_mission_futures.append(future)
+        self._update_play_button()
+
+        log.info("All missions have been started.")
+
+    def stop_both_missions(self):
+        """
+        Handles the "Stop Both Missions" button click.
+        Signals every robot's running mission to stop; waits inside a step end at once.
+        """
+        for robot in self.robots:
+            robot.stop_mission()
+        log.info("Stop requested for all missions.")
 
-            # Start playing Robot 2's mission
-            def play_robot2():
-                print("[DEBUG] Starting Robot 2's mission")
-                self.robot2.play_mission_specific(times)
+    def _run_mission(self, robot, times):
+        """
+        Plays a robot's mission and blocks until it finishes, so the pool
+        future tracks the whole mission rather than just its dispatch.
 
-            # Create threads for both missions
-            thread1 = threading.Thread(target=play_robot1, daemon=True)
-            thread2 = threading.Thread(target=play_robot2, daemon=True)
+        Args:
+            robot (RobotControlFrame): The robot to run the mission on.
+            times (int): Number of repetitions.
+        """
+        robot.play_mission_specific(times)
+        robot.wait_for_mission()
 
-            # Start both threads
-            thread1.start()
-            thread2.start()
+    def _missions_running(self):
+        """Returns True while any mission from the last dispatch is still running."""
+        return any(not future.done() for future in self._current_mission_futures)
 
-            print("Both missions have been started.")
+    def _on_mission_done(self, future, robot_name):
+        """
+        Re-enables the play button and reports a failed mission dispatch
+        back on the Tk thread. Runs on the pool worker, so Tk calls go
+        through _ui_queue.
 
-        # Start the play_both function in a new thread to prevent blocking
-        threading.Thread(target=play_both, daemon=True).start()
-        print("play_both_missions function executed.")
+        Args:
+            future (concurrent.futures.Future): The completed dispatch.
+            robot_name (str): Name of the robot the mission was dispatched to.
+        """
+        self._ui_queue.put(self._update_play_button)
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            log.error("Mission dispatch for %s failed: %s", robot_name, error)
+            self._ui_queue.put(lambda: messagebox.showerror("Error", f"Mission for {robot_name} failed: {error}"))
 
     def close_all_connections(self):
         """
         Handles the window close event by closing all serial connections.
         """
-        print("[DEBUG] Closing all serial connections")
-        # Close connections for both robots
-        self.robot1.close_connection()
-        self.robot2.close_connection()
+        log.debug("Closing all serial connections")
+        # Stop any running missions so pool workers can finish
+        for robot in self.robots:
+            robot.stop_mission()
+            robot.shutdown_executor()
+
+        # Stop jogging and cameras on the Tk thread, then close all ports in
+        # parallel so a busy port doesn't delay the others
+        robots = self.robots
+        for robot in robots:
+            robot.stop_continuous_move()
+            robot.stop_camera()
+        threads = [threading.Thread(target=robot.close_serial, daemon=True) for robot in robots]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 2.0
+        for robot, thread in zip(robots, threads):
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                log.warning("Serial port for %s did not close within 2 seconds", robot.robot_name)
+        self._mission_pool.shutdown(wait=False, cancel_futures=True)
+        if self.scheduler is not None:
+            self.scheduler.shutdown()
         self.master.quit()
-        print("[DEBUG] All serial connections closed and application exited")
+        log.debug("All serial connections closed and application exited")
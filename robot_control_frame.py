@@ -4,20 +4,250 @@ import customtkinter as ctk
 from tkinter import messagebox, simpledialog, filedialog
 import tkinter as tk
 from tkinter import ttk
-import json
 import time
 import threading
 import serial
 import cv2
+import numpy as np
 from PIL import Image, ImageTk
-from queue import Queue, Empty
+from queue import Queue, SimpleQueue, Empty, Full
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
 import logging
 
 from constants import STEP_TYPE_COLORS
+from utils import json_dumps, json_loads
+
+log = logging.getLogger(__name__)
+
+# Size (width, height) of the camera preview
+_CAMERA_SIZE = (400, 300)
+
+# Fixed button commands and their wire encoding, built once at import
+_FIXED_COMMANDS = {
+    "suction_on": {"T": 113, "pwm_a": 0, "pwm_b": 255},
+    "suction_off": {"T": 113, "pwm_a": 255, "pwm_b": 0},
+    "relay_off": {"T": 113, "pwm_a": 0, "pwm_b": 0},
+    "torque_on": {"T": 210, "cmd": 1},
+    "torque_off": {"T": 210, "cmd": 0},
+    "dynamic_adaptation_on": {"T": 112, "mode": 1, "b": 60, "s": 110, "e": 50, "h": 50},
+    "dynamic_adaptation_off": {"T": 112, "mode": 0, "b": 1000, "s": 1000, "e": 1000, "h": 1000},
+    "position_feedback": {"T": 105},
+    "led_on": {"T": 114, "led": 255},
+    "led_off": {"T": 114, "led": 0},
+}
+_FIXED_PAYLOADS = {name: json_dumps(cmd) + b"\n" for name, cmd in _FIXED_COMMANDS.items()}
+
+# Wire encoding of a T=104 move: (x, y, z, t, spd, acc). A fixed template
+# is much cheaper than the generic encoder on the jog path.
+_MOVE_FMT = b'{"T":104,"x":%.3f,"y":%.3f,"z":%.3f,"t":%.4f,"spd":%g,"acc":%g}\n'
+
+
+# Step type shown in the viewer for each command code; T=113 is split into
+# suction/relay by get_step_type
+_T_TO_TYPE = {104: "movement", 111: "delay", 114: "led", 210: "torque", 112: "dynamic_adaptation"}
+
+
+# Viewer "Details" text for each step type
+_DETAILS = {
+    "movement": lambda s: f"Move to (X:{s['x']}, Y:{s['y']}, Z:{s['z']}, T:{s['t']}) | Speed: {s['spd']} | Acc: {s['acc']}",
+    "suction": lambda s: "Suction ON" if s.get("pwm_b", 0) > 0 else "Suction OFF",
+    "relay": lambda s: "Relay Control",
+    "delay": lambda s: f"Delay for {s['cmd']} ms",
+    "led": lambda s: "LED ON" if s.get("led", 0) > 0 else "LED OFF",
+    "torque": lambda s: "Torque Enabled" if s.get("cmd", 0) == 1 else "Torque Disabled",
+    "dynamic_adaptation": lambda s: "Dynamic Adaptation Enabled" if s.get("mode", 0) == 1 else "Dynamic Adaptation Disabled",
+}
+
+
+def _unknown_details(s):
+    return f"Unknown Step Type: {s}"
+
+
+def _public(step):
+    """Returns a step without its cached "_" keys, as sent to the arm and saved."""
+    return {k: v for k, v in step.items() if not k.startswith("_")}
+
+
+def _fixed_step(name):
+    """Returns a new mission step for a fixed command, with its encoding already cached."""
+    return dict(_FIXED_COMMANDS[name], _wire=_FIXED_PAYLOADS[name])
+
+
+def _wire(step):
+    """Returns the encoded command line for a step, caching it on the step as "_wire"."""
+    try:
+        return step["_wire"]
+    except KeyError:
+        data = step["_wire"] = json_dumps(_public(step)) + b"\n"
+        return data
+
+
+class CameraBroker:
+    """
+    Owns one VideoCapture per camera index and hands each captured frame to
+    every subscriber, so robot frames showing the same camera share one
+    device and one decode.
+    """
+
+    def __init__(self, display_fps=30):
+        """
+        Args:
+            display_fps (int): Rate frames are decoded at; extra camera frames are grabbed and dropped.
+        """
+        self.display_fps = display_fps
+        self._lock = threading.Lock()
+        self._feeds = {}  # camera index -> feed dict
+
+    def subscribe(self, index, callback):
+        """
+        Starts delivering frames from a camera to callback, opening the camera
+        if no one is using it yet. Call from the Tk thread.
+
+        Callbacks run on the capture thread and receive a 300x400 RGB array
+        shared with the other subscribers (do not modify it), or None once
+        the camera stops delivering frames.
+
+        Args:
+            index (int): Camera index.
+            callback (callable): Called with each frame.
+
+        Returns:
+            bool: False if the camera could not be opened.
+        """
+        with self._lock:
+            feed = self._feeds.get(index)
+            if feed is not None:
+                feed["subscribers"].append(callback)
+                return True
+
+        capture = cv2.VideoCapture(index, cv2.CAP_DSHOW)
+        if not capture.isOpened():
+            return False
+        # Keep at most one buffered frame so the feed shows the newest image,
+        # prefer MJPEG, which USB cameras deliver fastest, and ask for frames
+        # at preview size so they needn't be resized. All are backend-specific.
+        try:
+            capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            capture.set(cv2.CAP_PROP_FRAME_WIDTH, _CAMERA_SIZE[0])
+            capture.set(cv2.CAP_PROP_FRAME_HEIGHT, _CAMERA_SIZE[1])
+        except cv2.error as e:
+            log.warning("Camera %s rejected capture settings: %s", index, e)
+        # Only decode as many frames as are displayed; the rest are grabbed and dropped
+        native_fps = capture.get(cv2.CAP_PROP_FPS) or self.display_fps
+        feed = {
+            "capture": capture,
+            "skip_n": max(1, int(native_fps / self.display_fps)),
+            "stop": threading.Event(),
+            "subscribers": [callback],
+            # Set under the lock by _worker and unsubscribe(); whichever
+            # finishes second releases the capture
+            "worker_done": False,
+            "unsubscribed": False,
+        }
+        feed["thread"] = threading.Thread(target=self._worker, args=(index, feed), daemon=True)
+        with self._lock:
+            self._feeds[index] = feed
+        feed["thread"].start()
+        return True
+
+    def unsubscribe(self, index, callback):
+        """
+        Stops delivering frames to callback; the last subscriber to leave
+        releases the camera. Call from the Tk thread.
+
+        Args:
+            index (int): Camera index.
+            callback (callable): The callback passed to subscribe().
+        """
+        with self._lock:
+            feed = self._feeds.get(index)
+            if feed is None or callback not in feed["subscribers"]:
+                return
+            feed["subscribers"].remove(callback)
+            if feed["subscribers"]:
+                return
+            del self._feeds[index]
+        feed["stop"].set()
+        feed["thread"].join(timeout=1)
+        # Only release once the worker is out of grab()/retrieve(); if it is
+        # still busy, it releases the capture itself when it exits
+        with self._lock:
+            feed["unsubscribed"] = True
+            release = feed["worker_done"]
+        if release:
+            feed["capture"].release()
+
+    def _worker(self, index, feed):
+        """Captures and converts frames for one camera and passes them to its subscribers."""
+        capture = feed["capture"]
+        stop = feed["stop"]
+        # One resize buffer for the feed's lifetime, used only if the camera
+        # ignored the requested size
+        bgr_buf = np.empty((_CAMERA_SIZE[1], _CAMERA_SIZE[0], 3), dtype=np.uint8)
+        preview_shape = bgr_buf.shape[:2]
+        size_logged = False
+        while not stop.is_set():
+            for _ in range(feed["skip_n"]):
+                capture.grab()
+            ret, frame = capture.retrieve()
+            if ret:
+                if frame.shape[:2] != preview_shape:
+                    if not size_logged:
+                        log.info("Camera %s delivers %dx%d frames; resizing to %dx%d.",
+                                 index, frame.shape[1], frame.shape[0], *_CAMERA_SIZE)
+                        size_logged = True
+                    # Resize first so the colour conversion touches fewer pixels
+                    frame = cv2.resize(frame, _CAMERA_SIZE, dst=bgr_buf)
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            else:
+                frame = None  # Tells subscribers the camera stopped
+            with self._lock:
+                subscribers = list(feed["subscribers"])
+                if frame is None and self._feeds.get(index) is feed:
+                    # Forget the dead feed so the next subscribe reopens the camera
+                    del self._feeds[index]
+                    released_here = True
+                else:
+                    released_here = False
+            for callback in subscribers:
+                callback(frame)
+            if frame is None:
+                if released_here:
+                    capture.release()
+                    return
+                break
+        # Stopped by unsubscribe()
+        with self._lock:
+            feed["worker_done"] = True
+            release = feed["unsubscribed"]
+        if release:
+            capture.release()
+
+
+# One broker per process, shared by every robot frame
+_camera_broker = CameraBroker()
 
 
 class RobotControlFrame:
-    def __init__(self, parent, com_port, robot_name):
+    _styles_ready = False  # Set once the shared ttk styles are configured
+
+    @classmethod
+    def _ensure_styles(cls, root):
+        """Configures the ttk styles shared by every robot frame, once per process."""
+        if cls._styles_ready:
+            return
+        style = ttk.Style(root)
+        style.configure("Treeview", rowheight=25)
+        style.map("Treeview", background=[('selected', '#347083')], foreground=[('selected', 'white')])
+        cls._styles_ready = True
+
+    def __init__(self, parent, com_port, robot_name, connect=True):
+        """
+        Sets up the robot state. With connect=False the caller must call
+        open_port() (blocking, safe off the Tk thread) and then
+        build_widgets() (on the Tk thread) itself.
+        """
         self.parent = parent
         self.com_port = com_port
         self.robot_name = robot_name
@@ -28,7 +258,14 @@ class RobotControlFrame:
         formatter = logging.Formatter(f'%(asctime)s - {robot_name} - %(levelname)s - %(message)s')
         handler.setFormatter(formatter)
         self.logger.addHandler(handler)
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False  # Has its own handler; avoid duplicate lines via root
+
+        # Queue for thread-safe GUI updates
+        self.gui_queue = SimpleQueue()
+        self._last_status = None  # Last text passed to _enqueue_status
+
+        self._ensure_styles(parent)
 
         self.current_position = {"x": 235.0, "y": 0.0, "z": 234.0, "t": 3.14}
         self.default_spd = 2.5
@@ -39,13 +276,28 @@ class RobotControlFrame:
 
         self.missions = {}
         self.selected_mission = None
+        # Mirrors selected_mission so widgets can trace selection changes
+        self.selected_mission_var = tk.StringVar(value="")
 
-        self.ser = self.initialize_serial(self.com_port, 115200)
+        self.ser = None
         self.moving_thread = None
         self.moving_stop_event = threading.Event()
 
-        self.mission_execution_thread = None
+        # Missions and single played steps run one at a time on this worker
+        self._exec_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{robot_name}-exec")
+        self._mission_future = None
         self.mission_execution_stop_event = threading.Event()
+        self._step_stop_event = threading.Event()  # Same role for play_step
+
+        # execute_step handler for each command code
+        self._executors = {
+            104: self._exec_move,
+            111: self._exec_delay,
+            112: self._exec_passthrough,
+            113: self._exec_passthrough,
+            114: self._exec_passthrough,
+            210: self._exec_passthrough,
+        }
         self.current_mission_step = 0
 
         self.dragging_item = None
@@ -54,32 +306,64 @@ class RobotControlFrame:
         self.available_cameras = self.detect_cameras()
         self.selected_camera = tk.StringVar(value="None")
         self.camera_label = None
-        self.video_capture = None
+        self.camera_index = None
         self.camera_update_job = None
         self.camera_running = False
+        self.display_fps = 30  # Rate at which the camera label is refreshed
+        # The shared camera broker hands the newest frame to the GUI through this queue
+        self.camera_queue = Queue(maxsize=1)
 
         self.speed_scale = 1.0
         self.distance_scale = 100.0
         self.base_delay = 0.5
         self.max_delay = 2.0
-
-        # Queue for thread-safe GUI updates
-        self.gui_queue = Queue()
+        # Seconds per unit of distance at the default speed; see execute_step
+        self._inv_scale = self.speed_scale / (self.distance_scale * self.default_spd)
 
         # Lock for movement synchronization
         self.movement_lock = threading.Lock()
 
+        # Serializes writes so concurrent senders never interleave bytes on the wire
+        self.serial_write_lock = threading.Lock()
+
+        # Commands waiting for the serial writer thread; bounded so a stalled
+        # port can't build an unbounded backlog
+        self._tx_queue = Queue(maxsize=64)
+
+        # Jog coalescing: the jog loop only updates the pending target and a
+        # single sender thread forwards the newest one once the line is free
+        self._pending_target = None
+        self._last_sent_target = None
+        self._jog_event = threading.Event()
+        self.jog_epsilon = 0.01  # Minimum |dx|+|dy|+|dz|+|dt| worth sending
+
         # Stop event for serial listener
         self.serial_listener_stop_event = threading.Event()
 
+        if connect:
+            self.open_port()
+            self.build_widgets()
+
+    def open_port(self):
+        """Opens the serial port and starts its listener. Blocks, but touches no Tk widgets."""
+        self.ser = self.initialize_serial(self.com_port, 115200)
+
         # Start the serial listener thread if serial is initialized
         if self.ser:
             self.serial_listener_thread = threading.Thread(target=self.serial_listener, daemon=True)
             self.serial_listener_thread.start()
             self.logger.info("Serial listener thread started.")
+            # The writer and jog sender share the listener's stop event; all
+            # three live as long as the port
+            self.serial_writer_thread = threading.Thread(target=self.serial_writer, daemon=True)
+            self.serial_writer_thread.start()
+            self.jog_sender_thread = threading.Thread(target=self.jog_sender, daemon=True)
+            self.jog_sender_thread.start()
         else:
             self.logger.error("Serial listener thread not started due to failed serial initialization.")
 
+    def build_widgets(self):
+        """Builds the widgets and starts the GUI update loop. Must run on the Tk thread."""
         self.create_widgets()
         self.move_to_current_position()
 
@@ -88,8 +372,22 @@ class RobotControlFrame:
 
     def initialize_serial(self, port, baudrate):
         try:
-            s = serial.Serial(port, baudrate, timeout=1)
-            time.sleep(2)  # Allow time for the serial connection to initialize
+            s = serial.Serial(None, baudrate, timeout=0.05, dsrdtr=False)
+            s.port = port
+            try:
+                # Hold both lines low through open(): DTR low alone with RTS
+                # asserted pulls the ESP32's EN low and keeps it in reset
+                s.dtr = False
+                s.rts = False
+            except (AttributeError, ValueError, serial.SerialException):
+                pass
+            s.open()
+            # Wait for the controller to speak rather than sleeping a fixed 2 s;
+            # a controller that is silent at idle still gets the full 2 s
+            for _ in range(40):
+                if s.in_waiting:
+                    break
+                time.sleep(0.05)
             self.logger.info(f"Serial port {port} opened successfully.")
             return s
         except serial.SerialException as e:
@@ -102,17 +400,10 @@ class RobotControlFrame:
             return None
 
     def detect_cameras(self):
-        available = []
-        for i in range(5):
-            cap = cv2.VideoCapture(i, cv2.CAP_DSHOW)
-            if cap and cap.isOpened():
-                available.append(str(i))
-                cap.release()
-        if not available:
-            available = ["None"]
-        else:
-            available.insert(0, "None")
-        self.logger.info(f"Available cameras: {available}")
+        # Opening a DirectShow device can take seconds, so cameras are not probed
+        # up front; start_camera drops an index from the list if it fails to open
+        available = ["None", "0", "1", "2", "3", "4"]
+        self.logger.info(f"Camera choices: {available}")
         return available
 
     def create_widgets(self):
@@ -139,19 +430,34 @@ class RobotControlFrame:
 
     def serial_listener(self):
         """Continuously listen for incoming serial data."""
+        buf = bytearray()
+        # Checked once; the listener logs every line, so skip building debug records when they'd be dropped
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         while not self.serial_listener_stop_event.is_set():
             if self.ser and self.ser.is_open:
                 try:
-                    line = self.ser.readline().decode('utf-8').strip()
-                    if line:
-                        self.logger.debug(f"Received data: {line}")
-                        try:
-                            data = json.loads(line)
-                            self.handle_serial_data(data)
-                        except json.JSONDecodeError:
-                            self.logger.warning(f"Invalid JSON received: {line}")
-                    else:
+                    waiting = self.ser.in_waiting
+                    if not waiting:
+                        # Nothing buffered; poll again shortly instead of blocking in readline()
+                        self.serial_listener_stop_event.wait(0.005)
                         continue
+                    buf += self.ser.read(waiting)
+                    # Handle every complete line received so far
+                    end = buf.find(b"\n")
+                    while end != -1:
+                        line = bytes(buf[:end]).strip()
+                        del buf[:end + 1]
+                        end = buf.find(b"\n")
+                        if not line:
+                            continue
+                        if debug:
+                            self.logger.debug("Received data: %r", line)
+                        try:
+                            data = json_loads(line)
+                        except ValueError:  # Bad JSON or bad UTF-8
+                            self.logger.warning("Invalid JSON received: %r", line)
+                            continue
+                        self.handle_serial_data(data)
                 except serial.SerialException as e:
                     self.logger.error(f"SerialException in listener: {e}")
                     self.show_error("Serial Error", f"Serial exception: {e}")
@@ -173,15 +479,15 @@ class RobotControlFrame:
                 self.current_position["y"] = data.get("y", self.current_position["y"])
                 self.current_position["z"] = data.get("z", self.current_position["z"])
                 self.current_position["t"] = data.get("t", self.current_position["t"])
-                self.logger.info(f"Position updated from T=1051: {self.current_position}")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Position updated: {self.current_position}."))
+                self.logger.info("Position updated from T=1051: %s", self.current_position)
+                self._enqueue_status(f"{self.robot_name}: Position updated: {self.current_position}.")
         elif t_value == 105:  # Assuming T=105 is another type of acknowledgment
             # Handle other types of acknowledgments if necessary
             self.logger.debug("Received T=105 acknowledgment.")
             pass
         else:
             # Handle other message types if necessary
-            self.logger.warning(f"Unknown message type received: {data}")
+            self.logger.warning("Unknown message type received: %s", data)
 
     def move_to_current_position(self):
         cmd = {
@@ -193,8 +499,9 @@ class RobotControlFrame:
             "spd": self.default_spd,
             "acc": self.default_acc
         }
-        self.send_command_in_thread(cmd)
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Movement command sent."))
+        payload = _MOVE_FMT % (cmd["x"], cmd["y"], cmd["z"], cmd["t"], cmd["spd"], cmd["acc"])
+        self.send_command_in_thread(cmd, payload, droppable=True)
+        self._enqueue_status(f"{self.robot_name}: Movement command sent.")
         self.logger.info(f"Movement command sent: {cmd}")
 
     def create_webcam_controls(self, parent, row, column):
@@ -238,23 +545,31 @@ class RobotControlFrame:
             self.start_camera(int(selection))
 
     def start_camera(self, camera_index):
-        """Start capturing from the selected camera index."""
+        """Start showing the selected camera index."""
         self.stop_camera()
-        self.video_capture = cv2.VideoCapture(camera_index, cv2.CAP_DSHOW)
-        if not self.video_capture.isOpened():
+        if not _camera_broker.subscribe(camera_index, self._on_camera_frame):
+            # Drop the index so it isn't offered again
+            if str(camera_index) in self.available_cameras:
+                self.available_cameras.remove(str(camera_index))
+                self.camera_dropdown.configure(values=self.available_cameras)
+            self.selected_camera.set("None")
             self.show_error("Camera Error", f"Unable to access camera {camera_index}.")
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Failed to start camera {camera_index}."))
+            self._enqueue_status(f"{self.robot_name}: Failed to start camera {camera_index}.")
             return
+        self.camera_index = camera_index
+        # Reuse one Tk photo for the whole session
+        self._imgtk = ImageTk.PhotoImage("RGB", _CAMERA_SIZE)
+        self.camera_label.configure(image=self._imgtk)
         self.camera_running = True
-        self.update_camera_feed()
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Camera {camera_index} started."))
+        self.camera_update_job = self.parent.after(int(1000 / self.display_fps), self._drain_camera_queue)
+        self._enqueue_status(f"{self.robot_name}: Camera {camera_index} started.")
 
     def stop_camera(self):
-        """Stop capturing from the current camera feed."""
+        """Stop showing the current camera feed."""
         if self.camera_running:
             self.camera_running = False
-            if self.video_capture and self.video_capture.isOpened():
-                self.video_capture.release()
+            _camera_broker.unsubscribe(self.camera_index, self._on_camera_frame)
+            self.camera_index = None
             self.camera_label.config(image='')
             if self.camera_update_job:
                 try:
@@ -262,25 +577,42 @@ class RobotControlFrame:
                 except RuntimeError:
                     pass
                 self.camera_update_job = None
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Camera stopped."))
-
-    def update_camera_feed(self):
-        """Continuously update the camera feed in the GUI."""
-        if self.camera_running and self.video_capture.isOpened():
-            ret, frame = self.video_capture.read()
-            if ret:
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame = cv2.resize(frame, (400, 300))
-                image = Image.fromarray(frame)
-                imgtk = ImageTk.PhotoImage(image=image)
-                self.camera_label.imgtk = imgtk
-                self.camera_label.configure(image=imgtk)
-            else:
-                self.stop_camera()
             try:
-                self.camera_update_job = self.parent.after(33, self.update_camera_feed)
-            except RuntimeError:
+                self.camera_queue.get_nowait()
+            except Empty:
                 pass
+            self._enqueue_status(f"{self.robot_name}: Camera stopped.")
+
+    def _on_camera_frame(self, frame):
+        """Broker callback (capture thread): keeps only the newest frame queued for the GUI."""
+        try:
+            self.camera_queue.get_nowait()
+        except Empty:
+            pass
+        try:
+            self.camera_queue.put_nowait(frame)
+        except Full:
+            # Another feed's worker refilled the slot first (camera switch); its frame is as new
+            pass
+
+    def _drain_camera_queue(self):
+        """Shows the newest captured frame in the GUI."""
+        if not self.camera_running:
+            return
+        try:
+            frame = self.camera_queue.get_nowait()
+        except Empty:
+            pass
+        else:
+            if frame is None:
+                self.stop_camera()
+                return
+            # Paste into the existing photo instead of building a new Tk image per frame
+            self._imgtk.paste(Image.fromarray(frame))
+        try:
+            self.camera_update_job = self.parent.after(int(1000 / self.display_fps), self._drain_camera_queue)
+        except RuntimeError:
+            pass
 
     def create_xyz_controls(self, parent, row, column):
         frame = ctk.CTkFrame(parent, corner_radius=6)
@@ -373,36 +705,27 @@ class RobotControlFrame:
                       width=100, height=30, font=("Arial", 10)).pack(side="left", padx=5, pady=5, expand=True, fill="x")
 
     def suction_on(self):
-        cmd = {"T": 113, "pwm_a": 0, "pwm_b": 255}
-        self.send_command_in_thread(cmd)
-        self.logger.info("Suction turned ON.")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Suction turned ON."))
+        cmd = self.send_fixed_command("suction_on")
+        self._notify(logging.INFO, "Suction turned ON.")
 
         if self.selected_mission:
-            self.missions[self.selected_mission]["steps"].append(cmd)
-            self.update_mission_steps_viewer()
+            self._append_step(cmd)
             self.logger.info("Suction On command added to mission.")
 
     def suction_off(self):
-        cmd = {"T": 113, "pwm_a": 255, "pwm_b": 0}
-        self.send_command_in_thread(cmd)
-        self.logger.info("Suction turned OFF.")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Suction turned OFF."))
+        cmd = self.send_fixed_command("suction_off")
+        self._notify(logging.INFO, "Suction turned OFF.")
 
         if self.selected_mission:
-            self.missions[self.selected_mission]["steps"].append(cmd)
-            self.update_mission_steps_viewer()
+            self._append_step(cmd)
             self.logger.info("Suction Off command added to mission.")
 
     def relay_off(self):
-        cmd = {"T": 113, "pwm_a": 0, "pwm_b": 0}
-        self.send_command_in_thread(cmd)
-        self.logger.info("Relay turned OFF.")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Relay turned OFF."))
+        cmd = self.send_fixed_command("relay_off")
+        self._notify(logging.INFO, "Relay turned OFF.")
 
         if self.selected_mission:
-            self.missions[self.selected_mission]["steps"].append(cmd)
-            self.update_mission_steps_viewer()
+            self._append_step(cmd)
             self.logger.info("Relay Off command added to mission.")
 
     def create_extra_controls(self, parent, row, column):
@@ -425,47 +748,35 @@ class RobotControlFrame:
                       width=140, height=30, font=("Arial", 10)).grid(row=0, column=3, padx=5, pady=5, sticky="ew")
 
     def enable_torque(self):
-        cmd = {"T": 210, "cmd": 1}
-        self.send_command_in_thread(cmd)
-        self.logger.info("Torque enabled.")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Torque enabled."))
+        cmd = self.send_fixed_command("torque_on")
+        self._notify(logging.INFO, "Torque enabled.")
 
         if self.selected_mission:
-            self.missions[self.selected_mission]["steps"].append(cmd)
-            self.update_mission_steps_viewer()
+            self._append_step(cmd)
             self.logger.info("Torque Enable command added to mission.")
 
     def disable_torque(self):
-        cmd = {"T": 210, "cmd": 0}
-        self.send_command_in_thread(cmd)
-        self.logger.info("Torque disabled.")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Torque disabled."))
+        cmd = self.send_fixed_command("torque_off")
+        self._notify(logging.INFO, "Torque disabled.")
 
         if self.selected_mission:
-            self.missions[self.selected_mission]["steps"].append(cmd)
-            self.update_mission_steps_viewer()
+            self._append_step(cmd)
             self.logger.info("Torque Disable command added to mission.")
 
     def enable_dynamic_adaptation(self):
-        cmd = {"T": 112, "mode": 1, "b": 60, "s": 110, "e": 50, "h": 50}
-        self.send_command_in_thread(cmd)
-        self.logger.info("Dynamic Adaptation enabled.")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Dynamic Adaptation enabled."))
+        cmd = self.send_fixed_command("dynamic_adaptation_on")
+        self._notify(logging.INFO, "Dynamic Adaptation enabled.")
 
         if self.selected_mission:
-            self.missions[self.selected_mission]["steps"].append(cmd)
-            self.update_mission_steps_viewer()
+            self._append_step(cmd)
             self.logger.info("Dynamic Adaptation Enable command added to mission.")
 
     def disable_dynamic_adaptation(self):
-        cmd = {"T": 112, "mode": 0, "b": 1000, "s": 1000, "e": 1000, "h": 1000}
-        self.send_command_in_thread(cmd)
-        self.logger.info("Dynamic Adaptation disabled.")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Dynamic Adaptation disabled."))
+        cmd = self.send_fixed_command("dynamic_adaptation_off")
+        self._notify(logging.INFO, "Dynamic Adaptation disabled.")
 
         if self.selected_mission:
-            self.missions[self.selected_mission]["steps"].append(cmd)
-            self.update_mission_steps_viewer()
+            self._append_step(cmd)
             self.logger.info("Dynamic Adaptation Disable command added to mission.")
 
     def create_mission_steps(self, parent, row, column):
@@ -510,10 +821,11 @@ class RobotControlFrame:
         self.mission_steps_tree.bind("<ButtonPress-1>", self.on_treeview_click)
         self.mission_steps_tree.bind("<B1-Motion>", self.on_treeview_drag)
         self.mission_steps_tree.bind("<ButtonRelease-1>", self.on_treeview_drop)
-
-        style = ttk.Style()
-        style.configure("Treeview", rowheight=25)
-        style.map("Treeview", background=[('selected', '#347083')], foreground=[('selected', 'white')])
+        for tp, clr in STEP_TYPE_COLORS.items():
+            self.mission_steps_tree.tag_configure(tp, background=clr)
+        self.mission_steps_tree.tag_configure("drag_target", background="#FFD700")
+        self._drag_highlight_iid = None  # Row currently showing the drop-target colour
+        self._step_rows = 0  # Rows currently in the tree; see _refresh_step_rows
 
         self.progress_frame = ctk.CTkFrame(frame, corner_radius=6)
         self.progress_frame.pack(pady=5, fill="x", padx=10)
@@ -538,10 +850,9 @@ class RobotControlFrame:
             "spd": self.default_spd,
             "acc": self.default_acc
         }
-        self.missions[self.selected_mission]["steps"].append(step)
-        self.update_mission_steps_viewer()
+        self._append_step(step)
         self.logger.info(f"Step added with position: {self.current_position}")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Step added to mission."))
+        self._enqueue_status(f"{self.robot_name}: Step added to mission.")
 
     def edit_step_event(self, event):
         self.edit_step()
@@ -551,7 +862,7 @@ class RobotControlFrame:
         if not selected_item:
             self.show_error("Error", f"No step selected for {self.robot_name}.")
             return
-        index = self.mission_steps_tree.index(selected_item)
+        index = self._iid_to_index(selected_item[0])
         step = self.missions[self.selected_mission]["steps"][index]
         x = simpledialog.askfloat("Edit Step", "X:", initialvalue=step.get("x", self.current_position["x"]), parent=self.parent)
         if x is None: return
@@ -571,27 +882,26 @@ class RobotControlFrame:
             return
         new_step = {"T": 104, "x": x, "y": y, "z": z, "t": t, "spd": spd, "acc": acc}
         self.missions[self.selected_mission]["steps"][index] = new_step
-        self.update_mission_steps_viewer()
+        self._refresh_step_rows(index, index + 1)
         self.logger.info(f"Step {index + 1} updated: {new_step}")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Step {index + 1} updated."))
+        self._enqueue_status(f"{self.robot_name}: Step {index + 1} updated.")
 
     def delete_step(self):
         selected_item = self.mission_steps_tree.selection()
         if not selected_item:
             self.show_error("Error", f"No step selected for {self.robot_name}.")
             return
-        index = self.mission_steps_tree.index(selected_item)
+        index = self._iid_to_index(selected_item[0])
         del self.missions[self.selected_mission]["steps"][index]
-        self.update_mission_steps_viewer()
-        self.logger.info(f"Step {index + 1} deleted.")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Step {index + 1} deleted."))
+        self._refresh_step_rows(index)  # Renumbers the rows after the deleted one
+        self._notify(logging.INFO, f"Step {index + 1} deleted.")
 
     def set_speed(self):
         spd = simpledialog.askfloat("Set Speed", "Enter speed factor:", initialvalue=self.default_spd, parent=self.parent)
         if spd and spd > 0:
             self.default_spd = spd
-            self.logger.info(f"Speed set to {self.default_spd}")
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Speed set to {self.default_spd}"))
+            self._inv_scale = self.speed_scale / (self.distance_scale * self.default_spd)
+            self._notify(logging.INFO, f"Speed set to {self.default_spd}")
         else:
             self.show_error("Invalid Input", "Speed must be a positive number.")
 
@@ -601,10 +911,8 @@ class RobotControlFrame:
             return
         delay = simpledialog.askinteger("Add Delay", "ms:", initialvalue=1000, parent=self.parent)
         if delay is not None and delay >= 0:
-            self.missions[self.selected_mission]["steps"].append({"T": 111, "cmd": delay})
-            self.update_mission_steps_viewer()
-            self.logger.info(f"Delay of {delay} ms added.")
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Delay of {delay} ms added."))
+            self._append_step({"T": 111, "cmd": delay})
+            self._notify(logging.INFO, f"Delay of {delay} ms added.")
         else:
             self.show_error("Invalid Input", "Delay must be a non-negative integer.")
 
@@ -613,46 +921,45 @@ class RobotControlFrame:
         if not selected_item:
             self.show_error("Error", f"No step selected for {self.robot_name}.")
             return
-        index = self.mission_steps_tree.index(selected_item)
+        index = self._iid_to_index(selected_item[0])
         step = self.missions[self.selected_mission]["steps"][index]
 
+        self._step_stop_event.clear()
+
         def run_step():
             try:
-                self.execute_step(step)
-                self.queue_gui_update(lambda: self.update_progress_bar(100))
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Step {index + 1} played successfully."))
+                self.execute_step(step, self._step_stop_event)
+                self.update_progress_bar(100)
+                self._enqueue_status(f"{self.robot_name}: Step {index + 1} played successfully.")
             except Exception as e:
                 self.show_error("Error", f"Failed to execute step: {e}")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Failed to execute step {index + 1}."))
+                self._enqueue_status(f"{self.robot_name}: Failed to execute step {index + 1}.")
     
-        threading.Thread(target=run_step, daemon=True).start()
-        self.logger.info(f"Playing step {index + 1}.")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Playing step {index + 1}."))
+        self._exec_pool.submit(run_step)
+        self._notify(logging.INFO, f"Playing step {index + 1}.")
 
     def add_led_on_step(self):
         if not self.selected_mission:
             self.show_error("Error", f"No mission selected for {self.robot_name}.")
             return
-        self.missions[self.selected_mission]["steps"].append({"T": 114, "led": 255})
-        self.update_mission_steps_viewer()
+        self._append_step(_fixed_step("led_on"))
         self.logger.info("LED On step added.")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: LED On step added to mission."))
+        self._enqueue_status(f"{self.robot_name}: LED On step added to mission.")
 
     def add_led_off_step(self):
         if not self.selected_mission:
             self.show_error("Error", f"No mission selected for {self.robot_name}.")
             return
-        self.missions[self.selected_mission]["steps"].append({"T": 114, "led": 0})
-        self.update_mission_steps_viewer()
+        self._append_step(_fixed_step("led_off"))
         self.logger.info("LED Off step added.")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: LED Off step added to mission."))
+        self._enqueue_status(f"{self.robot_name}: LED Off step added to mission.")
 
     def update_step(self):
         selected_item = self.mission_steps_tree.selection()
         if not selected_item:
             self.show_error("Error", f"No step selected for {self.robot_name}.")
             return
-        index = self.mission_steps_tree.index(selected_item)
+        index = self._iid_to_index(selected_item[0])
         step = self.missions[self.selected_mission]["steps"][index]
         if self.get_step_type(step) != "movement":
             self.show_error("Error", "Selected step is not a position step.")
@@ -667,16 +974,16 @@ class RobotControlFrame:
             "acc": self.default_acc
         }
         self.missions[self.selected_mission]["steps"][index] = updated_step
-        self.update_mission_steps_viewer()
+        self._refresh_step_rows(index, index + 1)
         self.logger.info(f"Step {index + 1} updated: {updated_step}")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Step {index + 1} updated."))
+        self._enqueue_status(f"{self.robot_name}: Step {index + 1} updated.")
 
     def insert_step(self):
         selected_item = self.mission_steps_tree.selection()
         if not selected_item:
             self.show_error("Error", f"No step selected for {self.robot_name}.")
             return
-        index = self.mission_steps_tree.index(selected_item)
+        index = self._iid_to_index(selected_item[0])
         new_step = {
             "T": 104,
             "x": self.current_position["x"],
@@ -687,40 +994,30 @@ class RobotControlFrame:
             "acc": self.default_acc
         }
         self.missions[self.selected_mission]["steps"].insert(index + 1, new_step)
-        self.update_mission_steps_viewer()
+        self._refresh_step_rows(index + 1)  # The new row and the renumbered rows after it
         self.logger.info(f"New step inserted after step {index + 1} with current position: {new_step}")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: New step inserted after step {index + 1}."))
+        self._enqueue_status(f"{self.robot_name}: New step inserted after step {index + 1}.")
     
     def duplicate_step(self):
         selected_item = self.mission_steps_tree.selection()
         if not selected_item:
             self.show_error("Error", f"No step selected for {self.robot_name}.")
             return
-        index = self.mission_steps_tree.index(selected_item)
+        index = self._iid_to_index(selected_item[0])
+        # Steps are never edited in place (edits replace the whole dict), so the
+        # duplicate can share the original's dict
         step_to_dup = self.missions[self.selected_mission]["steps"][index]
-        dup_step = step_to_dup.copy()
-        self.missions[self.selected_mission]["steps"].insert(index + 1, dup_step)
-        self.update_mission_steps_viewer()
+        self.missions[self.selected_mission]["steps"].insert(index + 1, step_to_dup)
+        self._refresh_step_rows(index + 1)  # The copy and the renumbered rows after it
         self.logger.info(f"Step {index + 1} duplicated and inserted as step {index + 2}.")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Step {index + 1} duplicated as step {index + 2}."))
+        self._enqueue_status(f"{self.robot_name}: Step {index + 1} duplicated as step {index + 2}.")
 
     def get_step_type(self, step):
         t_value = step.get("T")
-        if t_value == 104:
-            return "movement"
-        elif t_value == 113:
-            if "pwm_a" in step and "pwm_b" in step:
-                return "suction"
-            return "relay"
-        elif t_value == 111:
-            return "delay"
-        elif t_value == 114:
-            return "led"
-        elif t_value == 210:
-            return "torque"
-        elif t_value == 112:
-            return "dynamic_adaptation"
-        return "other"
+        if t_value == 113:
+            # Suction and relay share T=113; suction steps set both PWM channels
+            return "suction" if "pwm_a" in step and "pwm_b" in step else "relay"
+        return _T_TO_TYPE.get(t_value, "other")
 
     def create_mission_controls(self, parent, row, column):
         frame = ctk.CTkFrame(parent, corner_radius=6)
@@ -743,40 +1040,87 @@ class RobotControlFrame:
         ctk.CTkButton(btn_frame, text="Load Mission", command=self.load_mission,
                       width=120, height=30, font=("Arial", 10))\
             .grid(row=0, column=3, padx=2, pady=2, sticky="ew")
+        ctk.CTkButton(btn_frame, text="Stop Mission", command=self.stop_mission,
+                      width=120, height=30, font=("Arial", 10))\
+            .grid(row=1, column=2, padx=2, pady=2, sticky="ew")
 
     def update_mission_steps_viewer(self):
-        self.mission_steps_tree.delete(*self.mission_steps_tree.get_children())
-        if self.selected_mission in self.missions:
-            for idx, s in enumerate(self.missions[self.selected_mission]["steps"]):
-                step_num = idx + 1
-                stype = self.get_step_type(s)
-                if stype == "movement":
-                    details = f"Move to (X:{s['x']}, Y:{s['y']}, Z:{s['z']}, T:{s['t']}) | Speed: {s['spd']} | Acc: {s['acc']}"
-                elif stype == "suction":
-                    st = "ON" if s.get("pwm_b", 0) > 0 else "OFF"
-                    details = f"Suction {st}"
-                elif stype == "relay":
-                    details = f"Relay Control"
-                elif stype == "delay":
-                    details = f"Delay for {s['cmd']} ms"
-                elif stype == "led":
-                    st = "ON" if s.get("led", 0) > 0 else "OFF"
-                    details = f"LED {st}"
-                elif stype == "torque":
-                    en = "Enabled" if s.get("cmd", 0) == 1 else "Disabled"
-                    details = f"Torque {en}"
-                elif stype == "dynamic_adaptation":
-                    m = "Enabled" if s.get("mode", 0) == 1 else "Disabled"
-                    details = f"Dynamic Adaptation {m}"
-                else:
-                    details = f"Unknown Step Type: {s}"
-                iid = f"step_{idx+1}"
-                self.mission_steps_tree.insert("", "end", iid=iid, values=(step_num, details), tags=(stype,))
-        for tp, clr in STEP_TYPE_COLORS.items():
-            self.mission_steps_tree.tag_configure(tp, background=clr)
-        style = ttk.Style()
-        style.configure("Treeview", rowheight=25)
-        style.map("Treeview", background=[('selected', '#347083')], foreground=[('selected', 'white')])
+        """Syncs the steps viewer with the selected mission, reusing existing rows."""
+        # Unmap the tree while every row is rewritten so Tk lays it out once,
+        # then pack it back in the same slot
+        tree = self.mission_steps_tree
+        pack_info = tree.pack_info()
+        siblings = tree.master.pack_slaves()
+        after = siblings[siblings.index(tree) + 1:]
+        tree.pack_forget()
+        try:
+            self._refresh_step_rows(0)
+        finally:
+            if after:
+                pack_info["before"] = after[0]
+            tree.pack(**pack_info)
+
+    @staticmethod
+    def _iid_to_index(iid):
+        """Returns the step index of a viewer row; rows are positional, so "step_{n}" is step n-1."""
+        return int(iid.split("_", 1)[1]) - 1
+
+    def _append_step(self, step):
+        """Appends a step to the selected mission and adds its row to the viewer."""
+        steps = self.missions[self.selected_mission]["steps"]
+        steps.append(step)
+        self._refresh_step_rows(len(steps) - 1)
+
+    def _step_row(self, s):
+        """Returns the (details, step type) shown for a step in the steps viewer."""
+        try:
+            return s["_details"], s["_stype"]
+        except KeyError:
+            return self._annotate_step(s)
+
+    def _annotate_step(self, s):
+        """
+        Caches a step's viewer details and type on the step as "_details" and
+        "_stype". Steps are replaced rather than edited in place, so the cache
+        never goes stale; "_" keys are stripped before sending or saving.
+
+        Returns:
+            tuple: (details, step type)
+        """
+        stype = self.get_step_type(s)
+        details = _DETAILS.get(stype, _unknown_details)(s)
+        s["_details"] = details
+        s["_stype"] = stype
+        return details, stype
+
+    def _refresh_step_rows(self, start, stop=None):
+        """
+        Rewrites the viewer rows for steps[start:stop] in place.
+
+        Rows are positional (iid "step_{n}" is always the n-th row), so only
+        rows past the end of the tree are inserted and only surplus trailing
+        rows are deleted; everything else is an item() update.
+
+        Args:
+            start (int): Index of the first step whose row changed.
+            stop (int, optional): Index after the last changed step; defaults to the end of the mission.
+        """
+        tree = self.mission_steps_tree
+        steps = self.missions[self.selected_mission]["steps"] if self.selected_mission in self.missions else []
+        n = len(steps)
+        stop = n if stop is None else min(stop, n)
+        for idx in range(start, stop):
+            details, stype = self._step_row(steps[idx])
+            iid = f"step_{idx+1}"
+            if idx < self._step_rows:
+                tree.item(iid, values=(idx + 1, details), tags=(stype,))
+            else:
+                tree.insert("", "end", iid=iid, values=(idx + 1, details), tags=(stype,))
+        if self._step_rows < stop:
+            self._step_rows = stop
+        elif self._step_rows > n:
+            tree.delete(*(f"step_{idx+1}" for idx in range(n, self._step_rows)))
+            self._step_rows = n
 
     def create_bottom_buttons(self, parent, row, column):
         frame = ctk.CTkFrame(parent, corner_radius=6)
@@ -801,24 +1145,57 @@ class RobotControlFrame:
         lab = ctk.CTkLabel(sf, textvariable=self.status_var, anchor="w", font=("Arial", 10))
         lab.pack(fill="both", expand=True)
 
-    def update_status_bar(self, message):
-        self.status_var.set(message)
-        self.logger.info(message)
+    def _enqueue_status(self, message):
+        """Queues status bar text without building a closure. Safe from any thread."""
+        # Repeating the text already queued last wouldn't change the display
+        if message == self._last_status:
+            return
+        self._last_status = message
+        self.gui_queue.put(("status", message))
 
     def queue_gui_update(self, func):
         """Adds a GUI update function to the queue."""
-        self.gui_queue.put(func)
+        self.gui_queue.put(("call", func))
+
+    def _notify(self, level, msg):
+        """
+        Logs a message and shows it in the status bar. Safe from any thread.
+
+        Args:
+            level (int): Logging level, e.g. logging.INFO.
+            msg (str): Message, without the robot name prefix.
+        """
+        self.logger.log(level, msg)
+        self._enqueue_status(f"{self.robot_name}: {msg}")
 
     def process_gui_queue(self):
-        """Processes all pending GUI update functions."""
+        """
+        Processes all pending GUI updates, then polls again on the next frame
+        (~16 ms). Only the newest status text and progress value of each pass
+        are applied, so a burst of updates costs one redraw.
+        """
+        status = progress = None
+        queue = self.gui_queue
         try:
-            while True:
-                func = self.gui_queue.get_nowait()
-                func()
-        except Empty:
-            pass
+            # This is the only consumer, so empty() is reliable here
+            while not queue.empty():
+                tag, arg = queue.get()
+                if tag == "status":
+                    status = arg
+                elif tag == "progress":
+                    progress = arg
+                else:
+                    # Apply earlier status text first so a callback's own status update isn't overwritten
+                    if status is not None:
+                        self.status_var.set(status)
+                        status = None
+                    arg()
         finally:
-            self.parent.after(100, self.process_gui_queue)
+            if status is not None:
+                self.status_var.set(status)
+            if progress is not None:
+                self.progress_var.set(progress)
+            self.parent.after(16, self.process_gui_queue)
 
     def create_mission(self):
         name = simpledialog.askstring("Create Mission", "Name:", parent=self.parent)
@@ -827,10 +1204,14 @@ class RobotControlFrame:
                 self.show_error("Error", f"Mission '{name}' already exists.")
                 return
             self.missions[name] = {"name": name, "intro": "Mission", "steps": []}
-            self.selected_mission = name
+            self.select_mission(name)
             self.update_mission_steps_viewer()
-            self.logger.info(f"Mission '{name}' created.")
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Mission '{name}' created."))
+            self._notify(logging.INFO, f"Mission '{name}' created.")
+
+    def select_mission(self, name):
+        """Makes the named mission the active one. Must run on the Tk thread."""
+        self.selected_mission = name
+        self.selected_mission_var.set(name or "")
 
     def save_mission(self):
         if not self.selected_mission:
@@ -840,42 +1221,46 @@ class RobotControlFrame:
         if file_path:
             try:
                 data = self.missions[self.selected_mission]
-                with open(file_path, 'w') as f:
-                    header = {"name": data["name"], "intro": "Mission"}
-                    f.write(json.dumps(header, separators=(',', ':')) + "\n")
-                    for s in data["steps"]:
-                        f.write(json.dumps(s, separators=(',', ':')) + "\n")
+                header = {"name": data["name"], "intro": "Mission"}
+                # One JSON object per line, encoded in C when orjson is installed and written at once
+                lines = [json_dumps(header)]
+                lines.extend(json_dumps(_public(s)) for s in data["steps"])
+                lines.append(b"")
+                with open(file_path, 'wb') as f:
+                    f.write(b"\n".join(lines))
                 cmd = {"T": 221, "name": self.selected_mission}
                 self.send_command_in_thread(cmd)
                 self.logger.info(f"Mission '{self.selected_mission}' saved to {file_path}.")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Mission '{self.selected_mission}' saved to {file_path}."))  # Removed extra ')'
+                self._enqueue_status(f"{self.robot_name}: Mission '{self.selected_mission}' saved to {file_path}.")  # Removed extra ')'
             except Exception as e:
                 self.show_error("Error", f"Failed to save mission: {e}")
                 self.logger.error(f"Failed to save mission: {e}")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Failed to save mission: {e}."))
+                self._enqueue_status(f"{self.robot_name}: Failed to save mission: {e}.")
     
     def load_mission(self):
         file_path = filedialog.askopenfilename(defaultextension=".mission", filetypes=[("Mission Files", "*.mission")], parent=self.parent)
         if file_path:
             try:
-                with open(file_path, 'r') as f:
-                    lines = f.readlines()
-                header = json.loads(lines[0].strip())
+                with open(file_path, 'rb') as f:
+                    lines = f.read().split(b"\n")
+                header = json_loads(lines[0])
                 name = header.get("name", "unnamed_mission")
-                steps = [json.loads(l.strip()) for l in lines[1:]]
+                steps = [json_loads(l) for l in lines[1:] if l.strip()]
+                for step in steps:
+                    self._annotate_step(step)
                 if name in self.missions:
                     ow = messagebox.askyesno("Overwrite Mission", f"Mission '{name}' already exists. Overwrite?", parent=self.parent)
                     if not ow:
                         return
                 self.missions[name] = {"name": name, "intro": header.get("intro", "Mission"), "steps": steps}
-                self.selected_mission = name
+                self.select_mission(name)
                 self.update_mission_steps_viewer()
                 self.logger.info(f"Mission '{name}' loaded from {file_path}.")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Mission '{name}' loaded from {file_path}."))  # Removed extra ')'
+                self._enqueue_status(f"{self.robot_name}: Mission '{name}' loaded from {file_path}.")  # Removed extra ')'
             except Exception as e:
                 self.show_error("Error", f"Failed to load mission: {e}")
                 self.logger.error(f"Failed to load mission: {e}")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Failed to load mission: {e}."))
+                self._enqueue_status(f"{self.robot_name}: Failed to load mission: {e}.")
     
     def play_mission(self):
         if not self.selected_mission:
@@ -887,6 +1272,15 @@ class RobotControlFrame:
         self.play_mission_specific(times)
 
     def close_connection(self):
+        # End any running mission or step, stop the Tk-bound components, then
+        # release the serial port
+        self.stop_mission()
+        self.stop_continuous_move()
+        self.stop_camera()
+        self.close_serial()
+
+    def close_serial(self):
+        """Stops the serial threads and closes the port. Touches no Tk widgets, so it is safe off the main thread."""
         # Signal the serial listener to stop
         self.serial_listener_stop_event.set()
         self.logger.info("Stop event set for serial listener.")
@@ -897,21 +1291,18 @@ class RobotControlFrame:
             self.logger.info("Serial listener thread joined.")
         else:
             self.logger.info("Serial listener thread already stopped or was never started.")
-
-        # Proceed to stop other components
-        self.stop_continuous_move()
-        self.stop_camera()
+        if hasattr(self, 'serial_writer_thread') and self.serial_writer_thread.is_alive():
+            self.serial_writer_thread.join(timeout=1)
 
         # Close the serial connection
         if self.ser and self.ser.is_open:
             try:
                 self.ser.close()
-                self.logger.info("Serial connection closed.")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Serial connection closed."))
+                self._notify(logging.INFO, "Serial connection closed.")
             except Exception as e:
                 self.show_error("Error", f"Error closing serial connection: {e}")
                 self.logger.error(f"Error closing serial connection: {e}")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Error closing serial connection: {e}."))
+                self._enqueue_status(f"{self.robot_name}: Error closing serial connection: {e}.")
         else:
             self.logger.info("Serial connection already closed or was never opened.")
 
@@ -922,128 +1313,227 @@ class RobotControlFrame:
 
         def run_mission():
             try:
-                total_steps = len(self.missions[self.selected_mission]["steps"]) * times
+                steps = list(self.missions[self.selected_mission]["steps"])
+                total_steps = len(steps) * times
                 executed_steps = 0
-                for _ in range(times):
-                    for stp in self.missions[self.selected_mission]["steps"]:
+                last_pct = -1
+                # Move times for the first pass start from the arm's current
+                # position; later passes start from the mission's last move
+                with self.movement_lock:
+                    start = (self.current_position["x"], self.current_position["y"], self.current_position["z"])
+                first_tcs = self._move_times(steps, start)
+                moves = [stp for stp in steps if stp.get("T") == 104]
+                if times > 1 and moves:
+                    repeat_tcs = self._move_times(steps, (moves[-1]["x"], moves[-1]["y"], moves[-1]["z"]))
+                else:
+                    repeat_tcs = first_tcs
+                for rep in range(times):
+                    for stp, tc in zip(steps, first_tcs if rep == 0 else repeat_tcs):
                         if self.mission_execution_stop_event.is_set():
-                            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Mission execution stopped."))
+                            self._enqueue_status(f"{self.robot_name}: Mission execution stopped.")
                             return
-                        self.execute_step(stp)
+                        self.execute_step(stp, tc=tc)
                         executed_steps += 1
-                        prog = (executed_steps / total_steps) * 100
-                        self.queue_gui_update(lambda p=prog: self.update_progress_bar(p))
+                        # Only post progress when the whole percentage changes
+                        pct = executed_steps * 100 // total_steps
+                        if pct != last_pct:
+                            last_pct = pct
+                            self.update_progress_bar(pct)
                         # Movement commands are handled with sleep in execute_step
-                self.queue_gui_update(lambda: self.update_progress_bar(100))
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Mission '{self.selected_mission}' completed."))
-                self.logger.info(f"Mission '{self.selected_mission}' completed.")
+                self.update_progress_bar(100)
+                self._notify(logging.INFO, f"Mission '{self.selected_mission}' completed.")
             except Exception as e:
                 self.show_error("Error", f"Mission execution failed: {e}")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Mission execution failed: {e}."))
+                self._enqueue_status(f"{self.robot_name}: Mission execution failed: {e}.")
                 self.logger.error(f"Mission execution failed: {e}.")
 
-        self.queue_gui_update(lambda: self.update_progress_bar(0))
+        self.update_progress_bar(0)
         self.mission_execution_stop_event.clear()
-        self.mission_execution_thread = threading.Thread(target=run_mission, daemon=True)
-        self.mission_execution_thread.start()
-        self.logger.info(f"Playing mission '{self.selected_mission}' for {times} times.")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Playing mission '{self.selected_mission}' for {times} times."))
+        self._mission_future = self._exec_pool.submit(run_mission)
+        self._notify(logging.INFO, f"Playing mission '{self.selected_mission}' for {times} times.")
+
+    def _move_times(self, steps, start):
+        """
+        Computes how long to wait after each movement step of a mission, in one
+        numpy pass, using the same formula as execute_step.
+
+        Args:
+            steps (list): Mission steps, in order.
+            start (tuple): (x, y, z) position the arm starts from.
+
+        Returns:
+            list: Seconds to wait for each step; None for non-movement steps.
+        """
+        tcs = [None] * len(steps)
+        idx = [i for i, stp in enumerate(steps) if stp.get("T") == 104]
+        if not idx:
+            return tcs
+        pts = np.array([start] + [(steps[i]["x"], steps[i]["y"], steps[i]["z"]) for i in idx], dtype=np.float64)
+        spd = np.array([steps[i].get("spd", self.default_spd) for i in idx], dtype=np.float64)
+        dist = np.abs(np.diff(pts, axis=0)).max(axis=1)
+        moves = np.minimum(dist / self.distance_scale * (self.speed_scale / spd) + self.base_delay, self.max_delay)
+        for i, tc in zip(idx, moves.tolist()):
+            tcs[i] = tc
+        return tcs
+
+    def stop_mission(self):
+        """Signals a running mission (or single played step) to stop; waits inside a step end at once."""
+        self.mission_execution_stop_event.set()
+        self._step_stop_event.set()
+        self.logger.info("Stop event set for mission execution.")
+
+    def shutdown_executor(self):
+        """Drops queued steps and missions and stops the execution worker for good. Only call on app exit."""
+        self._exec_pool.shutdown(wait=False, cancel_futures=True)
+
+    def wait_for_mission(self, timeout=None):
+        """Blocks until the current mission has finished, if any."""
+        future = self._mission_future
+        if future is not None:
+            wait_futures([future], timeout)
 
     def update_progress_bar(self, value):
-        def update():
-            self.progress_var.set(value)
+        """Queues a new mission progress value (0-100). Safe from any thread."""
+        self.gui_queue.put(("progress", value))
+
+    def send_fixed_command(self, name):
+        """Sends a fixed button command from its pre-encoded bytes and returns a new mission step for it."""
+        self.send_command_in_thread(_FIXED_COMMANDS[name], _FIXED_PAYLOADS[name])
+        return _fixed_step(name)
+
+    def send_command_in_thread(self, command, payload=None, droppable=False, wait=False):
+        """
+        Queues a command dict for the serial writer thread.
+
+        Args:
+            command (dict): The command to send.
+            payload (bytes, optional): Its already-encoded line.
+            droppable (bool): The command is a preview move the next one
+                supersedes; it is dropped if the transmit queue is full.
+            wait (bool): Called from a worker thread (mission steps); waits
+                briefly for room and raises RuntimeError if there is none.
+                Otherwise a full queue is reported at once, so the Tk thread
+                never blocks.
+        """
+        if not (self.ser and self.ser.is_open):
+            self.show_error("Serial Error", "Serial not open.")
+            self._enqueue_status(f"{self.robot_name}: Serial not open.")
+            self.logger.warning("Attempted to send command while serial port is not open.")
+            return
+        data = payload if payload is not None else json_dumps(command) + b"\n"  # Ensure proper termination
         try:
-            self.parent.after(0, update)
-        except RuntimeError:
-            pass
-
-    def send_command_in_thread(self, command):
-        def send():
-            if self.ser and self.ser.is_open:
+            self._tx_queue.put_nowait((command, data))
+        except Full:
+            if droppable:
+                self.logger.warning("Transmit queue full; dropped move command: %s", command)
+                return
+            if wait:
                 try:
-                    self.ser.reset_input_buffer()  # Clear input buffer before sending
-                    cmd_str = json.dumps(command) + "\n"  # Ensure proper termination
-                    self.ser.write(cmd_str.encode('utf-8'))
-                    self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Command sent: {command}"))
-                    self.logger.info(f"Command sent: {command}")
-                except Exception as e:
-                    self.show_error("Serial Error", f"Failed to send command: {e}")
-                    self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Failed to send command: {e}."))
-                    self.logger.error(f"Error sending command: {e}")
-            else:
-                self.show_error("Serial Error", "Serial not open.")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Serial not open."))
-                self.logger.warning("Attempted to send command while serial port is not open.")
-        threading.Thread(target=send, daemon=True).start()
-
-    def execute_step(self, step):
-        if step["T"] == 104:
+                    self._tx_queue.put((command, data), timeout=1)
+                    return
+                except Full:
+                    raise RuntimeError(f"Transmit queue is full; command not sent: {command}")
+            self.show_error("Serial Error", "Transmit queue is full; command not sent.")
+            self.logger.error(f"Transmit queue full; dropped command: {command}")
+
+    def serial_writer(self):
+        """Writes queued commands to the port in order, one line at a time."""
+        while not self.serial_listener_stop_event.is_set():
+            try:
+                command, data = self._tx_queue.get(timeout=0.1)
+            except Empty:
+                continue
+            try:
+                with self.serial_write_lock:
+                    self.ser.write(data)
+                # Callers post their own status text; this runs for every mission step
+                self.logger.debug("Command sent: %s", command)
+            except Exception as e:
+                self.show_error("Serial Error", f"Failed to send command: {e}")
+                self._enqueue_status(f"{self.robot_name}: Failed to send command: {e}.")
+                self.logger.error(f"Error sending command: {e}")
+        self.logger.info("Serial writer thread exiting.")
+
+    def execute_step(self, step, stop_event=None, tc=None):
+        """
+        Sends one mission step and waits for it to take effect.
+
+        Args:
+            step (dict): The step to execute.
+            stop_event (threading.Event, optional): Cuts the wait short when set;
+                defaults to mission_execution_stop_event.
+            tc (float, optional): Precomputed wait for a movement step (see
+                _move_times); computed from the current position if omitted.
+        """
+        if stop_event is None:
+            stop_event = self.mission_execution_stop_event
+        self._executors.get(step.get("T"), self._exec_unknown)(step, stop_event, tc)
+
+    def _exec_move(self, step, stop_event, tc):
+        if tc is None:
             # Calculate the distance to move
             dx = abs(self.current_position["x"] - step["x"])
             dy = abs(self.current_position["y"] - step["y"])
             dz = abs(self.current_position["z"] - step["z"])
             mx = max(dx, dy, dz)
-            
+
             # Calculate the time required for movement
             spd = step.get("spd", self.default_spd)
-            tc = (mx / self.distance_scale) * (self.speed_scale / spd) + self.base_delay
+            if spd == self.default_spd:
+                tc = mx * self._inv_scale + self.base_delay
+            else:
+                tc = (mx / self.distance_scale) * (self.speed_scale / spd) + self.base_delay
             tc = min(tc, self.max_delay)  # Ensure tc does not exceed max_delay
-            
-            # Send the movement command
-            self.send_command_in_thread(step)
-            self.logger.info(f"Executed movement command: {step}")
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Movement command executed."))
-            
-            # Sleep to allow the robot to execute the movement
-            time.sleep(tc)
-            
-            # Update the current position
-            with self.movement_lock:
-                self.current_position.update({
-                    "x": step["x"],
-                    "y": step["y"],
-                    "z": step["z"],
-                    "t": step["t"]
-                })
-                self.logger.info(f"Position updated to: {self.current_position}")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Position updated to: {self.current_position}."))
-            
-        elif step["T"] == 111:
-            # Delay command
-            delay_ms = step.get("cmd", 1000)
-            self.logger.info(f"Executing delay for {delay_ms} ms.")
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Executing delay for {delay_ms} ms."))
-            time.sleep(delay_ms / 1000.0)
-            self.logger.info(f"Delay of {delay_ms} ms completed.")
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Delay of {delay_ms} ms completed."))
-            
-        elif step["T"] in [113, 114, 210, 112]:
-            # Other commands (suction, relay, torque, dynamic adaptation)
-            self.send_command_in_thread(step)
-            self.logger.info(f"Executed command: {step}")
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Command executed."))
-            
-        else:
-            self.logger.warning(f"Unknown Step Type: {step}")
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Unknown Step Type: {step}."))
-    
+
+        # Send the movement command, encoded once per step and reused on repeat passes
+        cmd = _public(step)
+        self.send_command_in_thread(cmd, _wire(step), wait=True)
+        self.logger.info("Executed movement command: %s", cmd)
+        self._enqueue_status(f"{self.robot_name}: Movement command executed.")
+
+        # Allow the robot to execute the movement; a stop ends the wait early
+        stop_event.wait(tc)
+
+        # Update the current position (the command is already on its way)
+        with self.movement_lock:
+            self.current_position.update({
+                "x": step["x"],
+                "y": step["y"],
+                "z": step["z"],
+                "t": step["t"]
+            })
+            self._notify(logging.INFO, f"Position updated to: {self.current_position}.")
+
+    def _exec_delay(self, step, stop_event, tc):
+        delay_ms = step.get("cmd", 1000)
+        self._notify(logging.INFO, f"Executing delay for {delay_ms} ms.")
+        if stop_event.wait(delay_ms / 1000.0):
+            self._notify(logging.INFO, f"Delay of {delay_ms} ms interrupted.")
+            return
+        self._notify(logging.INFO, f"Delay of {delay_ms} ms completed.")
+
+    def _exec_passthrough(self, step, stop_event, tc):
+        # Other commands (suction, relay, led, torque, dynamic adaptation) are sent as they are
+        cmd = _public(step)
+        self.send_command_in_thread(cmd, _wire(step), wait=True)
+        self.logger.info("Executed command: %s", cmd)
+        self._enqueue_status(f"{self.robot_name}: Command executed.")
+
+    def _exec_unknown(self, step, stop_event, tc):
+        self.logger.warning("Unknown Step Type: %s", step)
+        self._enqueue_status(f"{self.robot_name}: Unknown Step Type: {step}.")
+
     def update_position_once(self):
+        """Asks the arm for its position; the reply is handled by the serial listener."""
         if self.ser and self.ser.is_open:
-            self.ser.reset_input_buffer()
-            fb_cmd = {"T": 105}
-            try:
-                cmd_str = json.dumps(fb_cmd) + "\n"
-                self.ser.write(cmd_str.encode('utf-8'))
-                self.logger.info("Sent position update command.")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Position update command sent."))
-                # The response will be handled by the serial listener
-            except Exception as e:
-                self.show_error("Serial Error", f"Failed to send position update command: {e}")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Failed to send position update command: {e}."))
-                self.logger.error(f"Failed to send position update command: {e}")
+            # Goes through the serial writer thread like every other command,
+            # so the Tk thread never blocks on the port
+            self.send_fixed_command("position_feedback")
+            self.logger.info("Sent position update command.")
+            self._enqueue_status(f"{self.robot_name}: Position update command sent.")
         else:
             self.show_error("Serial Error", "Serial not open.")
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Serial not open."))
+            self._enqueue_status(f"{self.robot_name}: Serial not open.")
             self.logger.warning("Attempted to update position while serial port is not open.")
 
     def start_continuous_move(self, axis, delta):
@@ -1052,33 +1542,73 @@ class RobotControlFrame:
         self.moving_thread = threading.Thread(target=self.continuous_move_loop, args=(axis, delta), daemon=True)
         self.moving_thread.start()
         self.logger.info(f"Started continuous move on {axis}-axis with delta {delta}.")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Started continuous move on {axis}-axis."))
+        self._enqueue_status(f"{self.robot_name}: Started continuous move on {axis}-axis.")
 
     def stop_continuous_move(self):
         if self.moving_thread and self.moving_thread.is_alive():
             self.moving_stop_event.set()
             self.moving_thread.join()
-            self.logger.info("Stopped continuous move.")
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Stopped continuous move."))
+            self._notify(logging.INFO, "Stopped continuous move.")
         self.moving_thread = None
 
     def continuous_move_loop(self, axis, delta):
+        # The status only changes when the move starts, not on every tick
+        self._enqueue_status(f"{self.robot_name}: Moving {axis} by {delta}.")
+        # Progress is logged once a second rather than on every tick
+        ticks = 0
+        last_log = time.monotonic()
         while not self.moving_stop_event.is_set():
             with self.movement_lock:
                 self.current_position[axis] += delta
-                cmd = {
-                    "T": 104,
-                    "x": self.current_position["x"],
-                    "y": self.current_position["y"],
-                    "z": self.current_position["z"],
-                    "t": self.current_position["t"],
-                    "spd": self.default_spd,
-                    "acc": self.default_acc
-                }
-                self.send_command_in_thread(cmd)
-                self.logger.info(f"Continuous move command sent: {cmd}")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Moving {axis} by {delta}."))
-            time.sleep(self.update_interval)
+                self._pending_target = (
+                    self.current_position["x"],
+                    self.current_position["y"],
+                    self.current_position["z"],
+                    self.current_position["t"]
+                )
+            self._jog_event.set()
+            ticks += 1
+            now = time.monotonic()
+            if now - last_log >= 1.0:
+                self.logger.info("Continuous jog on %s: %d ticks, position %s", axis, ticks, self.current_position)
+                ticks = 0
+                last_log = now
+            # Returns as soon as the move is stopped
+            self.moving_stop_event.wait(self.update_interval)
+
+    def jog_sender(self):
+        """
+        Sends the newest jog target. Targets queued while a write is in flight,
+        or while the previous jog move is still playing out, are coalesced.
+        """
+        stop_event = self.serial_listener_stop_event
+        next_send = 0.0  # Monotonic time the previous jog move should be done by
+        while not stop_event.is_set():
+            if not self._jog_event.wait(0.1):
+                continue
+            delay = next_send - time.monotonic()
+            if delay > 0 and stop_event.wait(delay):
+                break
+            self._jog_event.clear()
+            with self.movement_lock:
+                target = self._pending_target
+            last = self._last_sent_target
+            if target is None or not (self.ser and self.ser.is_open):
+                continue
+            if last is not None and sum(abs(a - b) for a, b in zip(target, last)) < self.jog_epsilon:
+                continue
+            payload = _MOVE_FMT % (*target, self.default_spd, self.default_acc)
+            try:
+                with self.serial_write_lock:
+                    self.ser.write(payload)
+                self._last_sent_target = target
+                # Estimated travel time at the default speed (the arm's settle delay
+                # isn't included; jogging would stutter if it were)
+                if last is not None:
+                    next_send = time.monotonic() + max(abs(a - b) for a, b in zip(target[:3], last[:3])) * self._inv_scale
+                self.logger.debug("Continuous move command sent: %r", payload)  # Once per jog tick
+            except Exception as e:
+                self.logger.error(f"Error sending continuous move command: {e}")
 
     def init_robot(self):
         """Resets the robot to its startup position."""
@@ -1093,40 +1623,40 @@ class RobotControlFrame:
             "spd": self.default_spd,
             "acc": self.default_acc
         }
-        self.send_command_in_thread(cmd)
+        payload = _MOVE_FMT % (cmd["x"], cmd["y"], cmd["z"], cmd["t"], cmd["spd"], cmd["acc"])
+        self.send_command_in_thread(cmd, payload)
         self.logger.info(f"Robot initialized to startup position: {self.current_position}")
-        self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Robot initialized to startup position."))
+        self._enqueue_status(f"{self.robot_name}: Robot initialized to startup position.")
 
         if self.selected_mission:
-            self.missions[self.selected_mission]["steps"].append(cmd)
-            self.update_mission_steps_viewer()
+            self._append_step(cmd)
             self.logger.info("Initialization command added to mission.")
 
     def on_treeview_click(self, event):
         item = self.mission_steps_tree.identify_row(event.y)
         if item:
             self.dragging_item = item
-            self.dragging_start_index = self.mission_steps_tree.index(item)
+            self.dragging_start_index = self._iid_to_index(item)
             self.logger.info(f"Dragging item: {item} at index {self.dragging_start_index}")
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Dragging step {self.dragging_start_index + 1}."))
+            self._enqueue_status(f"{self.robot_name}: Dragging step {self.dragging_start_index + 1}.")
         else:
             self.dragging_item = None
             self.dragging_start_index = None
             self.logger.info("No item found at click position.")
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: No step selected for dragging."))
+            self._enqueue_status(f"{self.robot_name}: No step selected for dragging.")
 
     def on_treeview_drag(self, event):
         if self.dragging_item:
             t_item = self.mission_steps_tree.identify_row(event.y)
             if t_item and t_item != self.dragging_item:
-                self.mission_steps_tree.tag_remove("drag_target", *self.mission_steps_tree.tag_names())
-                self.mission_steps_tree.item(t_item, tags=("drag_target",))
-                self.mission_steps_tree.tag_configure("drag_target", background="#FFD700")
-                self.logger.info(f"Hovering over item: {t_item}")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Hovering over step {self.mission_steps_tree.index(t_item) + 1}."))
+                if t_item == self._drag_highlight_iid:
+                    return  # Still over the same row
+                self._set_drag_highlight(t_item)
+                self.logger.debug("Hovering over item: %s", t_item)  # Once per mouse motion event
+                self._enqueue_status(f"{self.robot_name}: Hovering over step {self._iid_to_index(t_item) + 1}.")
             else:
-                self.mission_steps_tree.tag_remove("drag_target", *self.mission_steps_tree.tag_names())
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Dragging step."))
+                self._set_drag_highlight(None)
+                self._enqueue_status(f"{self.robot_name}: Dragging step.")
 
     def on_treeview_drop(self, event):
         if self.dragging_item:
@@ -1135,27 +1665,41 @@ class RobotControlFrame:
                 if not drop_item:
                     drop_index = len(self.missions[self.selected_mission]["steps"])
                 else:
-                    drop_index = self.mission_steps_tree.index(drop_item)
+                    drop_index = self._iid_to_index(drop_item)
                 start_index = self.dragging_start_index
                 if drop_index > start_index:
                     drop_index -= 1
                 stp = self.missions[self.selected_mission]["steps"].pop(start_index)
                 self.missions[self.selected_mission]["steps"].insert(drop_index, stp)
-                self.update_mission_steps_viewer()
+                # Only rows between the old and new positions changed
+                self._refresh_step_rows(min(start_index, drop_index), max(start_index, drop_index) + 1)
                 new_iid = f"step_{drop_index + 1}"
                 self.mission_steps_tree.selection_set(new_iid)
                 self.mission_steps_tree.focus(new_iid)
                 self.mission_steps_tree.see(new_iid)
-                self.logger.info(f"Step moved from {start_index + 1} to {drop_index + 1}.")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Step moved from {start_index + 1} to {drop_index + 1}."))
+                self._notify(logging.INFO, f"Step moved from {start_index + 1} to {drop_index + 1}.")
             except Exception as e:
                 self.show_error("Error", f"Failed to move step: {e}")
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Failed to move step: {e}."))
+                self._enqueue_status(f"{self.robot_name}: Failed to move step: {e}.")
             finally:
                 self.dragging_item = None
                 self.dragging_start_index = None
-                self.mission_steps_tree.tag_remove("drag_target", *self.mission_steps_tree.tag_names())
-                self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Drag-and-drop operation completed."))
+                self._set_drag_highlight(None)
+                self._enqueue_status(f"{self.robot_name}: Drag-and-drop operation completed.")
+
+    def _set_drag_highlight(self, iid):
+        """Moves the drop-target highlight to the row iid (None clears it), restoring the previous row's colour."""
+        prev = self._drag_highlight_iid
+        if prev == iid:
+            return
+        if prev is not None:
+            steps = self.missions[self.selected_mission]["steps"]
+            index = self._iid_to_index(prev)
+            if index < len(steps):
+                self.mission_steps_tree.item(prev, tags=(self._step_row(steps[index])[1],))
+        if iid is not None:
+            self.mission_steps_tree.item(iid, tags=("drag_target",))
+        self._drag_highlight_iid = iid
 
     def show_error(self, title, message):
         def show():
@@ -1167,6 +1711,5 @@ class RobotControlFrame:
         if self.moving_thread and self.moving_thread.is_alive():
             self.moving_stop_event.set()
             self.moving_thread.join()
-            self.logger.info("Stopped continuous move.")
-            self.queue_gui_update(lambda: self.update_status_bar(f"{self.robot_name}: Stopped continuous move."))
+            self._notify(logging.INFO, "Stopped continuous move.")
         self.moving_thread = None
@@ -5,31 +5,80 @@ from tkinter import messagebox, filedialog, simpledialog
 import tkinter as tk  # Import tkinter for StringVar and other components
 from tkinter import ttk
 import threading
-import json
-import time
+import functools
+import logging
+import heapq
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta  # Import timedelta for scheduling next occurrences
 import os
+from queue import SimpleQueue, Empty
+from utils import json_dumps, json_loads
+
+log = logging.getLogger(__name__)
+
+# Dropdown options for the time picker and recurrence, built once
+_HOURS = tuple(f"{i:02d}" for i in range(1, 13))
+_MINUTES_SECONDS = tuple(f"{i:02d}" for i in range(60))
+_AM_PM = ("AM", "PM")
+_RECURRENCES = ("Once", "Daily", "Weekly")
+
+
+@functools.lru_cache(maxsize=64)
+def _load_mission_header(path, mtime):
+    """
+    Returns the parsed header line of a mission file. The modification time
+    is part of the cache key, so an edited file is re-read on its next fire.
+    """
+    with open(path, 'rb') as f:
+        return json_loads(f.readline())
+
 
 class SchedulerFrame(ctk.CTkFrame):
-    def __init__(self, parent, robot1, robot2):
+    def __init__(self, parent, robots):
         """
         Initializes the SchedulerFrame.
 
         Args:
             parent (ctk.CTkFrame): The parent frame (Scheduler tab).
-            robot1 (RobotControlFrame): Instance of Robot 1's control frame.
-            robot2 (RobotControlFrame): Instance of Robot 2's control frame.
+            robots (list[RobotControlFrame]): The robot control frames that missions can be scheduled on.
         """
         super().__init__(parent, corner_radius=10)
         self.parent = parent
-        self.robot1 = robot1
-        self.robot2 = robot2
+        self.robots = {robot.robot_name: robot for robot in robots}
 
         # Scheduled tasks list
         self.scheduled_tasks = []
+        # Treeview iid -> task, so a selected row maps straight to its task
+        self._iid_to_task = {}
+
+        # Pending fires as a min-heap of (fire datetime, tie-breaker, task),
+        # serviced by one scheduler thread that sleeps until the earliest one.
+        # Other threads hand it tasks through _new_fires; only the scheduler
+        # thread touches the heap.
+        self._task_heap = []
+        self._new_fires = SimpleQueue()
+        self._seq = itertools.count()
+        self._cv = threading.Condition()
+        # One single-worker pool per robot: missions on different robots run in
+        # parallel, but two due tasks never drive the same arm at once
+        self._run_pools = {
+            name: ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"scheduled-{name}")
+            for name in self.robots
+        }
+
+        # (Treeview iid, status) pairs from worker threads, applied on the Tk thread
+        self._status_q = SimpleQueue()
+        # Callables posted by worker threads to run on the Tk thread
+        self._call_q = SimpleQueue()
+        # File checks for new tasks run here, so a slow path never blocks Tk
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scheduler-io")
 
         self.create_widgets()
 
+        self.after(100, self._flush_status)
+        threading.Thread(target=self._scheduler_loop, daemon=True).start()
+
     def create_widgets(self):
         # Title
         title_label = ctk.CTkLabel(self, text="Mission Scheduler", font=("Arial", 16, "bold"))
@@ -43,8 +92,8 @@ class SchedulerFrame(ctk.CTkFrame):
         robot_label = ctk.CTkLabel(options_frame, text="Select Robot:", font=("Arial", 12))
         robot_label.grid(row=0, column=0, padx=5, pady=5, sticky="w")
 
-        self.robot_var = tk.StringVar(value="Robot 1")
-        robot_options = ["Robot 1", "Robot 2"]
+        robot_options = list(self.robots)
+        self.robot_var = tk.StringVar(value=robot_options[0])
         robot_dropdown = ctk.CTkOptionMenu(options_frame, variable=self.robot_var, values=robot_options)
         robot_dropdown.grid(row=0, column=1, padx=5, pady=5, sticky="w")
 
@@ -69,26 +118,22 @@ class SchedulerFrame(ctk.CTkFrame):
 
         # Hours Dropdown (1-12)
         self.hour_var = tk.StringVar(value="12")
-        hour_options = [f"{i:02d}" for i in range(1, 13)]
-        hour_dropdown = ctk.CTkOptionMenu(time_picker_frame, variable=self.hour_var, values=hour_options, width=60)
+        hour_dropdown = ctk.CTkOptionMenu(time_picker_frame, variable=self.hour_var, values=_HOURS, width=60)
         hour_dropdown.pack(side="left", padx=(0, 5))
 
         # Minutes Dropdown (00-59)
         self.minute_var = tk.StringVar(value="00")
-        minute_options = [f"{i:02d}" for i in range(0, 60)]
-        minute_dropdown = ctk.CTkOptionMenu(time_picker_frame, variable=self.minute_var, values=minute_options, width=60)
+        minute_dropdown = ctk.CTkOptionMenu(time_picker_frame, variable=self.minute_var, values=_MINUTES_SECONDS, width=60)
         minute_dropdown.pack(side="left", padx=(0, 5))
 
         # Seconds Dropdown (00-59)
         self.second_var = tk.StringVar(value="00")
-        second_options = [f"{i:02d}" for i in range(0, 60)]
-        second_dropdown = ctk.CTkOptionMenu(time_picker_frame, variable=self.second_var, values=second_options, width=60)
+        second_dropdown = ctk.CTkOptionMenu(time_picker_frame, variable=self.second_var, values=_MINUTES_SECONDS, width=60)
         second_dropdown.pack(side="left", padx=(0, 5))
 
         # AM/PM Dropdown
         self.am_pm_var = tk.StringVar(value="AM")
-        am_pm_options = ["AM", "PM"]
-        am_pm_dropdown = ctk.CTkOptionMenu(time_picker_frame, variable=self.am_pm_var, values=am_pm_options, width=60)
+        am_pm_dropdown = ctk.CTkOptionMenu(time_picker_frame, variable=self.am_pm_var, values=_AM_PM, width=60)
         am_pm_dropdown.pack(side="left", padx=(0, 5))
 
         # Recurrence Pattern Selection
@@ -96,8 +141,7 @@ class SchedulerFrame(ctk.CTkFrame):
         recurrence_label.grid(row=3, column=0, padx=5, pady=5, sticky="w")
 
         self.recurrence_var = tk.StringVar(value="Once")
-        recurrence_options = ["Once", "Daily", "Weekly"]
-        recurrence_dropdown = ctk.CTkOptionMenu(options_frame, variable=self.recurrence_var, values=recurrence_options, width=100)
+        recurrence_dropdown = ctk.CTkOptionMenu(options_frame, variable=self.recurrence_var, values=_RECURRENCES, width=100)
         recurrence_dropdown.grid(row=3, column=1, padx=5, pady=5, sticky="w")
 
         # Add to Schedule Button
@@ -150,19 +194,33 @@ class SchedulerFrame(ctk.CTkFrame):
         am_pm = self.am_pm_var.get()
         recurrence = self.recurrence_var.get()
 
+        # Construct time string
+        scheduled_time_str = f"{hour}:{minute}:{second} {am_pm}"
+
+        # Validate off the Tk thread; the task is added once the checks pass
+        self._io_pool.submit(self._validate_and_add, robot, mission_file, scheduled_time_str, recurrence)
+
+    def _validate_and_add(self, robot, mission_file, scheduled_time_str, recurrence):
+        """
+        Checks a new task's mission file and time on a worker thread, then
+        hands the task to the Tk thread to be added.
+
+        Args:
+            robot (str): Name of the robot to run the mission on.
+            mission_file (str): Path of the mission file.
+            scheduled_time_str (str): Time of day in "HH:MM:SS AM" form.
+            recurrence (str): "Once", "Daily" or "Weekly".
+        """
         # Validate inputs
         if not mission_file or not os.path.isfile(mission_file):
-            messagebox.showerror("Error", "Please select a valid mission file.")
+            self._call_q.put(lambda: messagebox.showerror("Error", "Please select a valid mission file."))
             return
 
-        # Construct time string
-        scheduled_time_str = f"{hour}:{minute}:{second} {am_pm}"
-
         try:
             # Parse the scheduled time in 12-hour format
             scheduled_time = datetime.strptime(scheduled_time_str, "%I:%M:%S %p").time()
         except ValueError:
-            messagebox.showerror("Error", "Please enter a valid time.")
+            self._call_q.put(lambda: messagebox.showerror("Error", "Please enter a valid time."))
             return
 
         # Create a scheduled task dictionary
@@ -171,17 +229,30 @@ class SchedulerFrame(ctk.CTkFrame):
             "mission_file": mission_file,
             "scheduled_time": scheduled_time_str,
             "recurrence": recurrence,
-            "status": "Pending"
+            "status": "Pending",
+            "last_fire": None,
+            "_cancel": threading.Event(),
+            "_time": scheduled_time,
+            "_basename": os.path.basename(mission_file)
         }
+        self._call_q.put(lambda: self._insert_task(task))
 
+    def _insert_task(self, task):
+        """
+        Adds a validated task to the Treeview and the schedule. Runs on the Tk thread.
+
+        Args:
+            task (dict): The scheduled task dictionary.
+        """
         # Insert into the Treeview
-        self.tasks_tree.insert("", "end", values=(robot, os.path.basename(mission_file), scheduled_time_str, recurrence, "Pending"))
+        task["_iid"] = self.tasks_tree.insert("", "end", values=(task["robot"], task["_basename"], task["scheduled_time"], task["recurrence"], "Pending"))
 
         # Add to the scheduled_tasks list
         self.scheduled_tasks.append(task)
+        self._iid_to_task[task["_iid"]] = task
 
-        # Start a thread to monitor and execute the task
-        threading.Thread(target=self.monitor_task, args=(task,), daemon=True).start()
+        # Queue the task's first fire
+        self._schedule(task)
 
         # Clear input fields
         self.mission_path_var.set("")
@@ -191,99 +262,200 @@ class SchedulerFrame(ctk.CTkFrame):
         self.am_pm_var.set("AM")
         self.recurrence_var.set("Once")
 
-        print(f"Scheduled mission for {robot} at {scheduled_time_str} with recurrence '{recurrence}'.")
+        log.info("Scheduled mission for %s at %s with recurrence '%s'.", task["robot"], task["scheduled_time"], task["recurrence"])
 
-    def monitor_task(self, task):
+    def _schedule(self, task):
         """
-        Monitors the current time and executes the mission when the scheduled time is reached.
-        Handles recurrence by rescheduling the task based on its recurrence pattern.
+        Computes the task's first fire time and queues it for the scheduler thread.
 
         Args:
             task (dict): The scheduled task dictionary.
         """
-        while True:
-            # Calculate the time difference
-            now = datetime.now()
-            try:
-                scheduled_time = datetime.strptime(task["scheduled_time"], "%I:%M:%S %p").time()
-            except ValueError:
-                print(f"Invalid time format for task: {task}")
-                self.update_task_status(task, "Invalid Time Format")
+        now = datetime.now()
+        scheduled_time = task["_time"]
+        if scheduled_time is None:
+            log.warning("Invalid time format for task: %s", task["scheduled_time"])
+            self.update_task_status(task, "Invalid Time Format")
+            return
+
+        scheduled_datetime = now.replace(hour=scheduled_time.hour, minute=scheduled_time.minute,
+                                         second=scheduled_time.second, microsecond=0)
+
+        if task["last_fire"] and task["recurrence"] in ("Daily", "Weekly"):
+            # Resume the cadence of a loaded recurring task: skip straight to
+            # the first period after its last fire that is still ahead
+            period = timedelta(days=1) if task["recurrence"] == "Daily" else timedelta(weeks=1)
+            last_fire = datetime.fromisoformat(task["last_fire"])
+            scheduled_datetime = last_fire + ((now - last_fire) // period + 1) * period
+        # If the scheduled time is earlier than now, adjust based on recurrence
+        elif scheduled_datetime < now:
+            if task["recurrence"] == "Daily":
+                scheduled_datetime += timedelta(days=1)
+            elif task["recurrence"] == "Weekly":
+                scheduled_datetime += timedelta(weeks=1)
+            else:
+                # Once and time has passed
+                self.update_task_status(task, "Time Passed")
                 return
 
-            scheduled_datetime = datetime.combine(now.date(), scheduled_time)
+        log.debug("Task for %s scheduled to run in %.0f seconds.", task["robot"], (scheduled_datetime - now).total_seconds())
+        task["_next_fire"] = scheduled_datetime
+        self._push(task)
+
+    def _push(self, task):
+        """
+        Hands the task's next fire to the scheduler thread and wakes it.
 
-            # If the scheduled time is earlier than now, adjust based on recurrence
-            if scheduled_datetime < now:
-                if task["recurrence"] == "Daily":
-                    scheduled_datetime += timedelta(days=1)
-                elif task["recurrence"] == "Weekly":
-                    scheduled_datetime += timedelta(weeks=1)
-                else:
-                    # Once and time has passed
-                    self.update_task_status(task, "Time Passed")
-                    return
+        Args:
+            task (dict): The scheduled task dictionary, with "_next_fire" set.
+        """
+        self._new_fires.put(task)
+        with self._cv:
+            self._cv.notify()
 
-            time_to_wait = (scheduled_datetime - now).total_seconds()
-            print(f"Task for {task['robot']} scheduled to run in {time_to_wait} seconds.")
+    def _scheduler_loop(self):
+        """
+        Waits for the earliest scheduled fire and hands due tasks to the run
+        pool. New tasks wake it through the condition variable.
+        """
+        # Bound once; the heap list itself is never replaced
+        cv, heap, heappop, now = self._cv, self._task_heap, heapq.heappop, datetime.now
+        heappush, seq, get_new = heapq.heappush, self._seq, self._new_fires.get_nowait
+        pools, execute, on_done = self._run_pools, self._execute_task, self._on_task_done
+        while True:
+            with cv:
+                # Move newly queued fires onto the heap
+                try:
+                    while True:
+                        task = get_new()
+                        heappush(heap, (task["_next_fire"], next(seq), task))
+                except Empty:
+                    pass
+                if not heap:
+                    cv.wait()
+                    continue
+                fire_datetime, _, task = heap[0]
+                if task["_cancel"].is_set():
+                    # Deleted while waiting; drop it without firing
+                    heappop(heap)
+                    continue
+                delay = (fire_datetime - now()).total_seconds()
+                if delay > 0:
+                    # Woken early when an earlier task is added
+                    cv.wait(delay)
+                    continue
+                heappop(heap)
+            # Saved with the schedule so a reload resumes from this fire
+            task["last_fire"] = fire_datetime.isoformat()
+            pool = pools.get(task["robot"])
+            if pool is None:
+                log.warning("Unknown robot: %s", task["robot"])
+                self.update_task_status(task, "Unknown Robot")
+                continue
+            future = pool.submit(execute, task)
+            future.add_done_callback(lambda f, task=task: on_done(task, f))
 
-            # Wait until the scheduled time
-            if time_to_wait > 0:
-                time.sleep(time_to_wait)
+    def _execute_task(self, task):
+        """
+        Runs a due task's mission and blocks until it finishes, so the pool
+        future tracks the whole mission rather than just its dispatch.
 
-            # Update the task status to Running
-            self.update_task_status(task, "Running")
+        Args:
+            task (dict): The scheduled task dictionary.
 
-            # Load the mission file
-            try:
-                with open(task["mission_file"], 'r') as f:
-                    lines = f.readlines()
-                header = json.loads(lines[0].strip())
-                mission_name = header.get("name", "Unnamed Mission")
-                print(f"Executing mission '{mission_name}' for {task['robot']}")
-            except Exception as e:
-                print(f"Failed to load mission file '{task['mission_file']}': {e}")
-                self.update_task_status(task, "Failed to Load")
-                return
+        Returns:
+            str: The task's resulting status.
+        """
+        self.update_task_status(task, "Running")
 
-            # Execute the mission
-            if task["robot"] == "Robot 1":
-                self.robot1.play_mission_specific(1)
-            elif task["robot"] == "Robot 2":
-                self.robot2.play_mission_specific(1)
-            else:
-                print(f"Unknown robot: {task['robot']}")
-                self.update_task_status(task, "Unknown Robot")
-                return
+        # Load the mission file
+        try:
+            header = _load_mission_header(task["mission_file"], os.path.getmtime(task["mission_file"]))
+            mission_name = header.get("name", "Unnamed Mission")
+            log.info("Executing mission '%s' for %s", mission_name, task["robot"])
+        except Exception as e:
+            log.error("Failed to load mission file '%s': %s", task["mission_file"], e)
+            return "Failed to Load"
+
+        # Execute the mission; the robot was checked when the task was dispatched
+        robot = self.robots[task["robot"]]
+        robot.play_mission_specific(1)
+        robot.wait_for_mission()
+
+        log.info("Mission '%s' for %s completed.", mission_name, task["robot"])
+        return "Completed"
+
+    def _on_task_done(self, task, future):
+        """
+        Records a finished task's status and queues the next occurrence of a
+        completed recurring task.
 
-            # Update the task status to Completed
-            self.update_task_status(task, "Completed")
-            print(f"Mission '{mission_name}' for {task['robot']} completed.")
+        Args:
+            task (dict): The scheduled task dictionary.
+            future (concurrent.futures.Future): The finished _execute_task call.
+        """
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            log.error("Scheduled mission for %s failed: %s", task["robot"], error)
+            self.update_task_status(task, "Failed")
+            return
 
-            # Handle recurrence
-            if task["recurrence"] == "Once":
-                break
-            elif task["recurrence"] in ["Daily", "Weekly"]:
-                # Reschedule the task
-                self.update_task_status(task, "Pending")
-                print(f"Rescheduling task for {task['robot']} with recurrence '{task['recurrence']}'.")
+        status = future.result()
+        # Handle recurrence, unless the task was deleted while it ran
+        if status == "Completed" and task["recurrence"] in ("Daily", "Weekly") and not task["_cancel"].is_set():
+            log.debug("Rescheduling task for %s with recurrence '%s'.", task["robot"], task["recurrence"])
+            status = "Pending"
+            # Step from the previous fire rather than re-deriving it from today
+            task["_next_fire"] += timedelta(days=1) if task["recurrence"] == "Daily" else timedelta(weeks=1)
+            self._push(task)
+        self.update_task_status(task, status)
+
+    def shutdown(self):
+        """
+        Stops the mission pools, dropping any fires that have not started yet.
+        """
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        for pool in self._run_pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def update_task_status(self, task, status):
         """
-        Updates the status of a scheduled task in the Treeview.
+        Queues a status change for a scheduled task's Treeview row. Safe to
+        call from any thread; the row is updated by _flush_status.
 
         Args:
             task (dict): The scheduled task dictionary.
             status (str): The new status (e.g., "Running", "Completed").
         """
-        for item in self.tasks_tree.get_children():
-            values = self.tasks_tree.item(item, "values")
-            if (values[0] == task["robot"] and
-                values[1] == os.path.basename(task["mission_file"]) and
-                values[2] == task["scheduled_time"] and
-                values[3] == task["recurrence"]):
-                self.tasks_tree.set(item, column="Status", value=status)
-                break
+        self._status_q.put((task["_iid"], status))
+
+    def _flush_status(self):
+        """
+        Applies queued status changes on the Tk thread, keeping only the
+        latest status per row, runs any posted callables, then reschedules itself.
+        """
+        try:
+            try:
+                while True:
+                    self._call_q.get_nowait()()
+            except Empty:
+                pass
+            latest = {}
+            try:
+                while True:
+                    iid, status = self._status_q.get_nowait()
+                    latest[iid] = status
+            except Empty:
+                pass
+            for iid, status in latest.items():
+                # The row may have been deleted or cleared by a load meanwhile
+                if self.tasks_tree.exists(iid):
+                    self.tasks_tree.set(iid, column="Status", value=status)
+        finally:
+            # Keep polling even if a posted callable raised
+            self.after(100, self._flush_status)
 
     def show_context_menu(self, event):
         """
@@ -305,25 +477,25 @@ class SchedulerFrame(ctk.CTkFrame):
         if not selected_item:
             messagebox.showerror("Error", "No task selected.")
             return
-        values = self.tasks_tree.item(selected_item, "values")
-        robot, mission_file, scheduled_time, recurrence, status = values
+        iid = selected_item[0]
+        task = self._iid_to_task[iid]
 
-        if status == "Running":
+        if self.tasks_tree.set(iid, "Status") == "Running":
             messagebox.showerror("Error", "Cannot delete a running task.")
             return
 
+        # Wake the scheduler thread so the pending fire is dropped
+        task["_cancel"].set()
+        with self._cv:
+            self._cv.notify()
+
         # Remove from scheduled_tasks list
-        for task in self.scheduled_tasks:
-            if (task["robot"] == robot and
-                os.path.basename(task["mission_file"]) == mission_file and
-                task["scheduled_time"] == scheduled_time and
-                task["recurrence"] == recurrence):
-                self.scheduled_tasks.remove(task)
-                break
+        self.scheduled_tasks.remove(task)
+        del self._iid_to_task[iid]
 
         # Remove from Treeview
-        self.tasks_tree.delete(selected_item)
-        print(f"Deleted scheduled task for {robot} at {scheduled_time} with recurrence '{recurrence}'.")
+        self.tasks_tree.delete(iid)
+        log.info("Deleted scheduled task for %s at %s with recurrence '%s'.", task["robot"], task["scheduled_time"], task["recurrence"])
 
     def save_schedule(self):
         """
@@ -343,13 +515,16 @@ class SchedulerFrame(ctk.CTkFrame):
 
         if file_path:
             try:
-                with open(file_path, 'w') as f:
-                    json.dump(self.scheduled_tasks, f, indent=4)
+                # Private "_" keys hold runtime state and aren't saved
+                tasks = [{k: v for k, v in task.items() if not k.startswith("_")} for task in self.scheduled_tasks]
+                data = json_dumps(tasks)
+                with open(file_path, 'wb') as f:
+                    f.write(data)
                 messagebox.showinfo("Success", f"Schedule saved to {file_path}")
-                print(f"Schedule saved to {file_path}")
+                log.info("Schedule saved to %s", file_path)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save schedule: {e}")
-                print(f"Failed to save schedule: {e}")
+                log.error("Failed to save schedule: %s", e)
 
     def load_schedule(self):
         """
@@ -364,32 +539,51 @@ class SchedulerFrame(ctk.CTkFrame):
 
         if file_path:
             try:
-                with open(file_path, 'r') as f:
-                    loaded_tasks = json.load(f)
-
-                # Clear existing tasks
-                self.tasks_tree.delete(*self.tasks_tree.get_children())
-                self.scheduled_tasks = []
-
-                for task in loaded_tasks:
-                    robot = task.get("robot", "Robot 1")
-                    mission_file = task.get("mission_file", "")
-                    scheduled_time_str = task.get("scheduled_time", "12:00:00 AM")
-                    recurrence = task.get("recurrence", "Once")
-                    status = task.get("status", "Pending")
-
-                    # Insert into Treeview
-                    self.tasks_tree.insert("", "end", values=(robot, os.path.basename(mission_file), scheduled_time_str, recurrence, status))
-
-                    # Add to scheduled_tasks list
-                    self.scheduled_tasks.append(task)
-
-                    # If the task was pending, start monitoring it
-                    if status == "Pending":
-                        threading.Thread(target=self.monitor_task, args=(task,), daemon=True).start()
+                with open(file_path, 'rb') as f:
+                    loaded_tasks = json_loads(f.read())
+
+                # Clear existing tasks, cancelling their pending fires
+                for task in self.scheduled_tasks:
+                    task["_cancel"].set()
+                with self._cv:
+                    self._cv.notify()
+                # Unpack the tree while rows are replaced so it is laid out once
+                self.tasks_tree.pack_forget()
+                try:
+                    self.tasks_tree.delete(*self.tasks_tree.get_children())
+                    self.scheduled_tasks = []
+                    self._iid_to_task = {}
+
+                    for task in loaded_tasks:
+                        robot = task.get("robot", "Robot 1")
+                        mission_file = task.get("mission_file", "")
+                        scheduled_time_str = task.get("scheduled_time", "12:00:00 AM")
+                        recurrence = task.get("recurrence", "Once")
+                        status = task.get("status", "Pending")
+                        task.setdefault("last_fire", None)
+                        task["_cancel"] = threading.Event()
+                        # Parse the time once; the string is kept for display and saving
+                        try:
+                            task["_time"] = datetime.strptime(scheduled_time_str, "%I:%M:%S %p").time()
+                        except ValueError:
+                            task["_time"] = None
+                        task["_basename"] = os.path.basename(mission_file)
+
+                        # Insert into Treeview
+                        task["_iid"] = self.tasks_tree.insert("", "end", values=(robot, task["_basename"], scheduled_time_str, recurrence, status))
+
+                        # Add to scheduled_tasks list
+                        self.scheduled_tasks.append(task)
+                        self._iid_to_task[task["_iid"]] = task
+
+                        # If the task was pending, queue its next fire
+                        if status == "Pending":
+                            self._schedule(task)
+                finally:
+                    self.tasks_tree.pack(side="left", fill="both", expand=True, padx=5, pady=5)
 
                 messagebox.showinfo("Success", f"Schedule loaded from {file_path}")
-                print(f"Schedule loaded from {file_path}")
+                log.info("Schedule loaded from %s", file_path)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load schedule: {e}")
-                print(f"Failed to load schedule: {e}")
+                log.error("Failed to load schedule: %s", e)